@@ -1,21 +1,29 @@
-from t8_client.cli import (
-    cli,
-    compare_spectra,
-    compute_spectrum,
-    get_spectrum,
-    get_wave,
-    list_all_waves,
-    list_spectra,
-    list_waves,
-    plot_spectrum,
-    plot_wave,
-)
-from t8_client.t8_client import (
-    BASE_URL,
-    T8ApiClient,
-    ensure_plots_directory,
-    get_plot_filename,
-)
+import importlib
+
+from t8_client.cli import cli
+from t8_client.commands import COMMANDS
+
+# Subcommands and the API client (requests, numpy, matplotlib) are imported on
+# first access so that loading the package, and with it the CLI entry point,
+# stays cheap.
+_COMMAND_MODULES = {module_name for module_name, _ in COMMANDS.values()}
+_CLIENT_NAMES = {
+    "BASE_URL",
+    "T8ApiClient",
+    "ensure_plots_directory",
+    "get_plot_filename",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _CLIENT_NAMES:
+        module = importlib.import_module("t8_client.t8_client")
+        return getattr(module, name)
+    if name in _COMMAND_MODULES:
+        module = importlib.import_module(f"t8_client.commands.{name}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "T8ApiClient",
@@ -32,4 +40,5 @@ __all__ = [
     "list_all_waves",
     "compute_spectrum",
     "compare_spectra",
+    "repl",
 ]
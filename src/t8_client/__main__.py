@@ -0,0 +1,62 @@
+"""Entry point of t8-cli.
+
+A bare ``t8-cli``, ``--help`` and ``--version`` are answered from the static
+command registry, without asking Click to build and run the command group.
+"""
+
+import sys
+from importlib.metadata import PackageNotFoundError, version
+
+from t8_client.commands import COMMANDS
+
+PROG_NAME = "t8-cli"
+_HELP_FLAGS = ("-h", "--help")
+
+
+def _static_help() -> str:
+    """Renders the top-level help from the command registry.
+
+    Returns:
+        str: The same text Click prints for ``t8-cli --help``
+    """
+    width = max(len(name) for name in COMMANDS) + 2
+    lines = [
+        f"Usage: {PROG_NAME} [OPTIONS] COMMAND [ARGS]...",
+        "",
+        "  CLI to interact with the T8 API.",
+        "",
+        "Options:",
+        "  --version   Show the version and exit.",
+        "  -h, --help  Show this message and exit.",
+        "",
+        "Commands:",
+    ]
+    lines += [f"  {name:<{width}}{COMMANDS[name][1]}" for name in sorted(COMMANDS)]
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Runs t8-cli, short-circuiting the help and version requests."""
+    args = sys.argv[1:]
+    if not args:
+        # Like Click with no_args_is_help: help on stderr, usage-error status
+        print(_static_help(), file=sys.stderr)
+        sys.exit(2)
+    if args[0] in _HELP_FLAGS:
+        print(_static_help())
+        sys.exit(0)
+    if args == ["--version"]:
+        try:
+            package_version = version("t8-client")
+        except PackageNotFoundError:
+            package_version = "unknown"
+        print(f"{PROG_NAME}, version {package_version}")
+        sys.exit(0)
+
+    from t8_client.cli import cli
+
+    cli(prog_name=PROG_NAME)
+
+
+if __name__ == "__main__":
+    main()
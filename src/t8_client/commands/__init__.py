@@ -0,0 +1,33 @@
+"""Subcommands of t8-cli, one module per command.
+
+The registry is plain data so the CLI can list every subcommand in its help
+without importing the modules that define them.
+"""
+
+# Command name -> (module defining it, help summary)
+COMMANDS = {
+    "chat-config": ("chat_config", "Chat with LLM about T8 configuration files."),
+    "compare-spectra": (
+        "compare_spectra",
+        "Compares an API spectrum with one calculated from a wave.",
+    ),
+    "compute-spectrum": (
+        "compute_spectrum",
+        "Computes the spectrum from a local JSON file.",
+    ),
+    "get-spectrum": (
+        "get_spectrum",
+        "Gets a specific spectrum or the most recent one.",
+    ),
+    "get-wave": ("get_wave", "Gets a specific wave or the most recent one."),
+    "list-all-waves": ("list_all_waves", "Lists all available waves."),
+    "list-spectra": (
+        "list_spectra",
+        "Lists spectra according to the specified parameters.",
+    ),
+    "list-waves": ("list_waves", "Lists waves according to the specified parameters."),
+    "model-info": ("model_info", "Muestra información sobre los modelos LLM."),
+    "plot-spectrum": ("plot_spectrum", "Generates a plot of the specified spectrum."),
+    "plot-wave": ("plot_wave", "Generates a plot of the specified wave."),
+    "repl": ("repl", "Runs commands read from stdin in a single session."),
+}
@@ -0,0 +1,408 @@
+import sys
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import click  # type: ignore
+
+from t8_client.commands.common import credentials
+
+if TYPE_CHECKING:
+    from llm_client import GroqLLMClient
+
+
+def _print_cache_stats(
+    llm_client: "GroqLLMClient", prefix: str = "   ", spaced: bool = False
+) -> None:
+    """Prints the analysis cache statistics, each line starting with prefix.
+
+    With spaced, a blank line separates the chunk types from the totals.
+    """
+    stats = llm_client.get_cache_stats()
+    if stats.get("available"):
+        size_kb = stats.get("total_size_bytes", 0) / 1024
+        gap = "\n" if spaced else ""
+        lines = [
+            f"{prefix}Total entries: {stats.get('total_entries', 0)}",
+            f"{prefix}Total size: {size_kb:.2f} KB",
+            f"{prefix}Configurations: {len(stats.get('configs', []))}",
+            f"{gap}{prefix}Chunk types:",
+        ]
+        lines.extend(
+            f"{prefix}   - {chunk_type}: {count}"
+            for chunk_type, count in stats.get("chunk_types", {}).items()
+        )
+    else:
+        lines = [f"{prefix}❌ {stats.get('message', 'Not available')}"]
+    click.echo("\n".join(lines))
+
+
+def _clear_cache(llm_client: "GroqLLMClient") -> None:
+    """Clears the analysis cache and reports the result."""
+    click.echo("🧹 Clearing analysis cache...")
+    result = llm_client.clear_cache()
+    if result["success"]:
+        click.echo(f"   ✅ {result['message']}")
+    else:
+        click.echo(f"   ❌ {result['message']}", err=True)
+
+
+def _emit_llm(
+    fn: Callable[..., object],
+    *,
+    stream: bool,
+    error_format: str = "\n❌ Error: {}\n",
+    **kwargs: object,
+) -> None:
+    """Calls an LLM client method and prints its answer in the assistant box.
+
+    Streamed chunks are written straight to stdout, flushing once per chunk,
+    instead of going through click.echo for every token. Errors are reported
+    on stderr with error_format.
+    """
+    out = sys.stdout.write
+    try:
+        if stream:
+            out("┌─ 🤖 Assistant\n│\n│  ")
+            flush = sys.stdout.flush
+            for chunk in fn(stream=True, **kwargs):
+                # Handle newlines to add prefix
+                out(chunk.replace("\n", "\n│  "))
+                flush()
+            out("\n└─\n\n")
+        else:
+            answer = fn(**kwargs)
+            body = "\n".join(f"│  {line}" for line in answer.split("\n"))
+            out(f"┌─ 🤖 Assistant\n│\n{body}\n└─\n\n")
+        sys.stdout.flush()
+    except Exception as e:
+        click.echo(error_format.format(e), err=True)
+
+
+@click.command()
+@click.option(
+    "-c",
+    "--config-file",
+    type=click.Path(exists=True),
+    help="Path to configuration file (default: uses API config)",
+)
+@click.option(
+    "-q",
+    "--question",
+    help="Single question to ask about the configuration",
+)
+@click.option(
+    "-i",
+    "--interactive",
+    is_flag=True,
+    help="Start interactive conversation mode",
+)
+@click.option(
+    "-s",
+    "--stream",
+    is_flag=True,
+    default=True,
+    help="Stream responses in real-time (enabled by default, use --no-stream to disable)",
+)
+@click.option(
+    "--no-stream",
+    is_flag=True,
+    help="Disable streaming responses",
+)
+@click.option(
+    "-t",
+    "--temperature",
+    type=float,
+    default=0.6,
+    help="Model temperature (0.0-1.0, default: 0.6)",
+)
+@click.option(
+    "--no-chunking",
+    is_flag=True,
+    help="Disable chunked analysis strategy (process config as a whole)",
+)
+@click.option(
+    "--verbose",
+    is_flag=True,
+    help="Show detailed progress during chunked analysis",
+)
+@click.option(
+    "--cache-max-age",
+    type=float,
+    default=24.0,
+    help="Max age of cache in hours (default: 24)",
+)
+@click.option(
+    "--clear-cache",
+    is_flag=True,
+    help="Clear the analysis cache and exit",
+)
+@click.option(
+    "--cache-stats",
+    is_flag=True,
+    help="Show cache statistics and exit",
+)
+def chat_config(
+    config_file: str | None = None,
+    question: str | None = None,
+    interactive: bool = False,
+    stream: bool = True,
+    no_stream: bool = False,
+    temperature: float = 0.6,
+    no_chunking: bool = False,
+    verbose: bool = False,
+    cache_max_age: float = 24.0,
+    clear_cache: bool = False,
+    cache_stats: bool = False,
+) -> None:
+    """Chat with LLM about T8 configuration files.
+
+    Uses "Divide and Conquer" strategy with caching for efficient analysis
+    of large configuration files.
+
+    Examples:
+
+        # Ask a single question about API config
+        t8-cli chat-config -q "What are the main measurement points?"
+
+        # Ask about a local config file with verbose output
+        t8-cli chat-config -c llm/config.json -q "What sampling rates?" --verbose
+
+        # Interactive mode with streaming
+        t8-cli chat-config -i -s
+
+        # Interactive mode with a specific file (no chunking)
+        t8-cli chat-config -c llm/config.json -i --no-chunking
+
+        # Clear the analysis cache
+        t8-cli chat-config --clear-cache
+
+        # Show cache statistics
+        t8-cli chat-config --cache-stats
+    """
+    import json
+
+    # Handle no_stream flag (overrides stream)
+    if no_stream:
+        stream = False
+
+    try:
+        from llm_client import GroqLLMClient
+    except ImportError:
+        click.echo(
+            "❌ Error: LLM client not available. Make sure 'groq' is installed.",
+            err=True,
+        )
+        click.echo("   Run: pip install groq", err=True)
+        return
+
+    # Initialize LLM client
+    try:
+        llm_client = GroqLLMClient()
+    except ValueError as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        click.echo(
+            "   Make sure GROQ_API_KEY is set in your .env file or environment.",
+            err=True,
+        )
+        return
+
+    # Handle cache management commands
+    if clear_cache:
+        _clear_cache(llm_client)
+        return
+
+    if cache_stats:
+        click.echo("📊 Cache Statistics:\n")
+        _print_cache_stats(llm_client, spaced=True)
+        return
+
+    # Load configuration
+    config_data = None
+    config_source = "API configuration"
+
+    # Load API definitions from DocComprimida.md if available
+    api_definitions = None
+    doc_file = "llm/DocComprimida.md"
+    try:
+        with open(doc_file, encoding="utf-8") as f:
+            api_definitions = f.read()
+        click.echo(f"✅ Loaded API documentation from: {doc_file}")
+    except FileNotFoundError:
+        click.echo(f"⚠️  API documentation not found at: {doc_file}")
+    except Exception as e:
+        click.echo(f"⚠️  Could not load API documentation: {e}")
+
+    if config_file:
+        # Load from file
+        try:
+            with open(config_file, encoding="utf-8") as f:
+                config_data = json.load(f)
+            config_source = config_file
+            click.echo(f"✅ Loaded configuration from: {config_file}")
+        except Exception as e:
+            click.echo(f"❌ Error loading config file: {e}", err=True)
+            return
+    else:
+        # Get configuration from API
+        from t8_client.t8_client import T8ApiClient
+
+        client = T8ApiClient()
+        username, password = credentials()
+
+        if not (username and password):
+            click.echo("❌ Error: T8 credentials not found in .env file", err=True)
+            return
+
+        if not client.login_with_credentials(username, password):
+            click.echo("❌ Error: Could not authenticate with T8 API", err=True)
+            return
+
+        # Try to get configuration from the API
+        try:
+            config_data = client.get_configuration()
+            if not config_data:
+                click.echo(
+                    "⚠️  Warning: Could not retrieve configuration from API",
+                    err=True,
+                )
+                click.echo("   Use -c to specify a local configuration file", err=True)
+                return
+            click.echo("✅ Loaded configuration from T8 API")
+        except Exception as e:
+            click.echo(f"❌ Error getting API configuration: {e}", err=True)
+            click.echo("   Use -c to specify a local configuration file", err=True)
+            return
+
+    llm_options = {
+        "config_data": config_data,
+        "api_definitions": api_definitions,
+        "temperature": temperature,
+        "use_chunking": not no_chunking,
+        "max_cache_age_hours": cache_max_age,
+        "verbose": verbose,
+    }
+
+    # Single question mode
+    if question and not interactive:
+        click.echo(f"\n🤔 Question: {question}")
+        if not no_chunking:
+            click.echo("🧩 Using chunked analysis strategy with cache...")
+        click.echo("💭 Thinking...\n")
+
+        _emit_llm(
+            llm_client.ask_about_config,
+            stream=stream,
+            error_format="\n❌ Error: {}",
+            question=question,
+            **llm_options,
+        )
+        return
+
+    # Interactive mode
+    if interactive or not question:
+        # The banner is only useful on a terminal, skip it when piped
+        tty = sys.stdout.isatty()
+        if tty:
+            click.echo("\n" + "=" * 70)
+            click.echo("🤖 T8 Configuration Chat - Interactive Mode")
+            click.echo("=" * 70)
+            click.echo(f"📋 Configuration: {config_source}")
+            click.echo(f"🌡️  Temperature: {temperature}")
+            click.echo(f"📡 Streaming: {'✅ Enabled' if stream else '❌ Disabled'}")
+            chunking_status = (
+                "❌ Disabled" if no_chunking else "✅ Enabled (with cache)"
+            )
+            click.echo(f"🧩 Chunking: {chunking_status}")
+            if not no_chunking:
+                click.echo(f"⏰ Cache age: {cache_max_age} hours")
+            click.echo("\n💡 Commands:")
+            click.echo("  • Type your question and press Enter")
+            click.echo("  • 'analyze' - Full configuration analysis")
+            click.echo("  • 'help' - Show example questions")
+            click.echo("  • 'cache-stats' - View cache statistics")
+            click.echo("  • 'clear-cache' - Clear analysis cache")
+            click.echo("  • 'exit' or 'quit' - Exit chat")
+            click.echo("=" * 70 + "\n")
+
+        while True:
+            try:
+                # Prompt del usuario con mejor formato
+                click.echo("┌─ 👤 You", nl=True)
+                click.echo("│ ", nl=False)
+                user_input = click.prompt("", type=str, prompt_suffix="", show_default=False)
+
+                if not user_input.strip():
+                    continue
+
+                # Check for exit commands
+                if user_input.lower() in ["exit", "quit", "q"]:
+                    click.echo("\n👋 Goodbye!")
+                    break
+
+                # Special commands
+                if user_input.lower() == "help":
+                    click.echo("\n┌─ 💡 Suggested Questions")
+                    click.echo("│")
+                    click.echo("│  • What machines are configured in this system?")
+                    click.echo("│  • What are the main measurement points?")
+                    click.echo("│  • What processing modes are available?")
+                    click.echo("│  • What parameters are being monitored?")
+                    click.echo("│  • What are the alarm thresholds for MAD31CY005?")
+                    click.echo("│  • Explain the storage strategies")
+                    click.echo("│  • What sampling rates are used?")
+                    click.echo("└─\n")
+                    continue
+
+                if user_input.lower() == "cache-stats":
+                    click.echo("\n┌─ 📊 Cache Statistics")
+                    _print_cache_stats(llm_client, prefix="│  ")
+                    click.echo("└─\n")
+                    continue
+
+                if user_input.lower() == "clear-cache":
+                    click.echo()
+                    _clear_cache(llm_client)
+                    click.echo()
+                    continue
+
+                if user_input.lower() == "analyze":
+                    click.echo("\n💭 Analyzing configuration...\n")
+                    _emit_llm(
+                        llm_client.analyze_t8_configuration,
+                        stream=stream,
+                        **llm_options,
+                    )
+                    continue
+
+                # Regular question
+                if tty:
+                    click.echo()
+                _emit_llm(
+                    llm_client.ask_about_config,
+                    stream=stream,
+                    question=user_input,
+                    **llm_options,
+                )
+
+            except (KeyboardInterrupt, EOFError):
+                click.echo("\n\n👋 Goodbye!")
+                break
+
+    # If no question and not interactive, show default analysis
+    elif not question:
+        click.echo("\n💭 Analyzing T8 configuration...\n")
+        if not no_chunking:
+            click.echo("🧩 Using chunked analysis strategy with cache...\n")
+
+        # The one-shot analysis does not send the API documentation
+        analysis_options = {
+            name: value
+            for name, value in llm_options.items()
+            if name != "api_definitions"
+        }
+        _emit_llm(
+            llm_client.analyze_t8_configuration,
+            stream=stream,
+            error_format="❌ Error: {}",
+            **analysis_options,
+        )
@@ -0,0 +1,163 @@
+import functools
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import click  # type: ignore
+
+from t8_client.env import ensure_env
+
+if TYPE_CHECKING:
+    from t8_client.t8_client import T8ApiClient
+
+# How long a cached login is reused before signing in again
+TOKEN_TTL_SECONDS = 30 * 60
+
+
+@functools.lru_cache(maxsize=1)
+def credentials() -> tuple[str | None, str | None]:
+    """Returns the T8 user and password, read once per process.
+
+    Returns:
+        tuple: (user, password), either of them None if not configured
+    """
+    ensure_env()
+    return os.environ.get("T8_USER"), os.environ.get("T8_PASSWORD")
+
+
+def _token_file() -> Path:
+    return Path.home() / ".cache" / "t8_client" / "token.json"
+
+
+def _load_token(username: str) -> dict[str, str] | None:
+    """Returns the cached session cookies of ``username``, if still valid."""
+    try:
+        cached = json.loads(_token_file().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if cached.get("username") != username or cached.get("expires_at", 0) <= time.time():
+        return None
+    return cached.get("token") or None
+
+
+def _save_token(username: str, token: dict[str, str]) -> None:
+    """Stores the session cookies of ``username``, readable only by the user."""
+    path = _token_file()
+    data = {
+        "username": username,
+        "token": token,
+        "expires_at": time.time() + TOKEN_TTL_SECONDS,
+    }
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # mkstemp creates the file as 0600; renaming it over the old one also
+        # replaces the mode of a token file left readable by an older version
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=path.name + ".", suffix=".tmp", dir=path.parent
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass  # The cache is an optimization, the login itself succeeded
+
+
+def _forget_token() -> None:
+    """Drops the cached login once the API has rejected it."""
+    _logged_in_client.cache_clear()
+    try:
+        _token_file().unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def authed_client() -> "T8ApiClient":
+    """Returns a T8ApiClient logged in with the credentials from the environment.
+
+    Inside ``t8-cli repl`` the client of the session, passed down as
+    ``ctx.obj["client"]``, is returned as is. Otherwise one client is kept per
+    process, so its connection pool is reused by every command, and the
+    session cookies are cached in ~/.cache/t8_client/token.json for
+    TOKEN_TTL_SECONDS, so consecutive invocations skip the login request.
+    The cache is dropped as soon as the API answers 401 Unauthorized.
+
+    Returns:
+        T8ApiClient: Client with an authenticated session
+
+    Raises:
+        click.ClickException: If the credentials are missing or rejected
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None and isinstance(ctx.obj, dict) and "client" in ctx.obj:
+        return ctx.obj["client"]
+
+    username, password = credentials()
+    if not (username and password):
+        raise click.ClickException("Credentials not found in .env file")
+    return _logged_in_client(username, password)
+
+
+@functools.lru_cache(maxsize=1)
+def _logged_in_client(username: str, password: str) -> "T8ApiClient":
+    from t8_client.t8_client import T8ApiClient
+
+    client = T8ApiClient()
+    client.on_unauthorized = _forget_token
+    token = _load_token(username)
+    if token:
+        client.set_token(token)
+        return client
+
+    if not client.login_with_credentials(username, password):
+        raise click.ClickException("Could not authenticate")
+    if client.token:
+        _save_token(username, client.token)
+    return client
+
+
+def resolve_when(date: str | None, timestamp: str | None) -> str:
+    """Picks the date or timestamp to request.
+
+    Args:
+        date: Value of -d/--date, if given
+        timestamp: Value of -t/--timestamp, if given
+
+    Returns:
+        str: The date or timestamp, or "0" for the most recent one
+
+    Raises:
+        click.UsageError: If both --date and --timestamp are given
+    """
+    if date and timestamp:
+        raise click.UsageError(
+            "Cannot specify both --date and --timestamp at the same time"
+        )
+    return date or timestamp or "0"
+
+
+def machine_point_mode_options(f: Callable) -> Callable:
+    """Adds the -M/--machine, -P/--point and -m/--mode options to a command."""
+    f = click.option("-m", "--mode", required=True, help="Processing mode")(f)
+    f = click.option("-P", "--point", required=True, help="Point of the machine")(f)
+    f = click.option("-M", "--machine", required=True, help="Machine ID")(f)
+    return f
+
+
+def date_options(f: Callable) -> Callable:
+    """Adds the -d/--date and -t/--timestamp options to a command."""
+    f = click.option("-t", "--timestamp", required=False, help="Unix timestamp")(f)
+    f = click.option(
+        "-d",
+        "--date",
+        required=False,
+        help="Date in ISO 8601 format (YYYY-MM-DDTHH:MM:SS)",
+    )(f)
+    return f
@@ -0,0 +1,34 @@
+from pathlib import Path
+
+import click  # type: ignore
+
+
+@click.command()
+@click.argument(
+    "spectrum_file", type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.argument(
+    "wave_file", type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Output file for the plot",
+)
+def compare_spectra(
+    spectrum_file: Path, wave_file: Path, output: Path | None = None
+) -> None:
+    """Compares an API spectrum with a spectrum calculated from a wave.
+
+    SPECTRUM_FILE: JSON file of the spectrum downloaded from the API
+    WAVE_FILE: JSON file of the wave to calculate the spectrum
+    """
+    from t8_client.compare import compare_spectra as run_comparison
+
+    try:
+        ok = run_comparison(spectrum_file, wave_file, output)
+    except Exception as e:
+        raise click.ClickException(f"Error comparing spectra: {e}") from e
+    if not ok:
+        raise click.ClickException("Spectrum comparison failed")
@@ -0,0 +1,15 @@
+from pathlib import Path
+
+import click  # type: ignore
+
+from t8_client.commands.common import authed_client
+
+
+@click.command()
+@click.argument(
+    "filename", type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+def compute_spectrum(filename: Path) -> None:
+    """Computes the spectrum from a local JSON file."""
+    client = authed_client()
+    client.compute_spectrum_with_json(filename)
@@ -0,0 +1,10 @@
+import click  # type: ignore
+
+from t8_client.commands.common import authed_client
+
+
+@click.command()
+def list_all_waves() -> None:
+    """Lists all available waves."""
+    client = authed_client()
+    client.list_available_waves()
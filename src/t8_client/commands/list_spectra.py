@@ -0,0 +1,16 @@
+import click  # type: ignore
+
+from t8_client.commands.common import (
+    authed_client,
+    machine_point_mode_options,
+)
+
+
+@click.command()
+@machine_point_mode_options
+def list_spectra(machine: str, point: str, mode: str) -> None:
+    """Lists spectra according to the specified parameters."""
+    client = authed_client()
+
+    # Call the correct method
+    client.list_spectra(machine, point, mode)
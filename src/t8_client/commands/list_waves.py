@@ -0,0 +1,16 @@
+import click  # type: ignore
+
+from t8_client.commands.common import (
+    authed_client,
+    machine_point_mode_options,
+)
+
+
+@click.command()
+@machine_point_mode_options
+def list_waves(machine: str, point: str, mode: str) -> None:
+    """Lists waves according to the specified parameters."""
+    client = authed_client()
+
+    # Call the corrected method
+    client.list_waves(machine, point, mode)
@@ -0,0 +1,74 @@
+import click  # type: ignore
+
+_SPEED_EMOJI = {"fast": "⚡", "medium": "🔄", "slow": "🐢"}
+_QUALITY_EMOJI = {"basic": "⭐", "good": "⭐⭐", "excellent": "⭐⭐⭐"}
+
+
+@click.command()
+def model_info() -> None:
+    """Muestra información sobre los modelos LLM disponibles y su estrategia de uso."""
+    try:
+        from llm_client.model_selector import ModelSelector
+
+        stats = ModelSelector.get_model_stats()
+
+        click.echo("🤖 **MODELOS LLM DISPONIBLES**\n")
+        click.echo(f"Total de modelos configurados: {stats['total_models']}\n")
+
+        click.echo("📊 **CATÁLOGO DE MODELOS:**\n")
+        for name, info in stats["models"].items():
+            tier_emoji = "💰" * info["cost_tier"]
+            speed_emoji = _SPEED_EMOJI.get(info["speed"], "❓")
+            quality_emoji = _QUALITY_EMOJI.get(info["quality"], "❓")
+
+            click.echo(f"  • {name}")
+            click.echo(f"    Velocidad: {speed_emoji} {info['speed']}")
+            click.echo(f"    Calidad: {quality_emoji} {info['quality']}")
+            click.echo(f"    Costo: {tier_emoji} Tier {info['cost_tier']}")
+            click.echo(f"    Uso: {info['description']}")
+            click.echo()
+
+        click.echo("🎯 **RECOMENDACIONES:**\n")
+        recs = stats["recommendations"]
+        click.echo(f"  ⚡ Más rápido: {recs['fastest']}")
+        click.echo(f"  ⚖️  Balanceado: {recs['balanced']}")
+        click.echo(f"  ⭐ Mejor calidad: {recs['best_quality']}")
+        click.echo(f"  �️  Fallback seguro: {recs['fallback_safe']}")
+
+        click.echo("\n🏗️ **ARQUITECTURA Y RENDIMIENTO:**\n")
+        arch_notes = stats.get("architecture_notes", {})
+        for model_name, note in arch_notes.items():
+            click.echo(f"  • {model_name}")
+            click.echo(f"    {note}")
+
+        click.echo("\n💡 **ESTRATEGIA DE FRAGMENTACIÓN (Oct 2025):**\n")
+        strategy = stats.get("strategy", {})
+        click.echo(
+            f"  📦 Fragmentos pequeños → {strategy.get('fragments_small', 'N/A')}"
+        )
+        click.echo(
+            f"  📦 Fragmentos grandes → {strategy.get('fragments_large', 'N/A')}"
+        )
+        click.echo(
+            f"  🔗 Agregación simple → {strategy.get('aggregation_simple', 'N/A')}"
+        )
+        click.echo(
+            f"  🔗 Agregación compleja → {strategy.get('aggregation_complex', 'N/A')}"
+        )
+
+        click.echo("\n📈 **EFICIENCIA ESPERADA (16 fragmentos):**")
+        click.echo("    • 37.5% llamadas Tier 1 (llama-3.1-8b-instant ~800 t/s)")
+        click.echo("    • 62.5% llamadas Tier 2 (Scout MoE ~500 t/s)")
+        click.echo("    • 1 llamada agregación final (70B si >12 fragmentos)")
+        click.echo("    • Promedio ponderado: ~612 t/s")
+        click.echo("    • Fallback automático: Tier 1 → Tier 2 → Tier 3")
+
+    except ImportError:
+        click.echo(
+            "❌ Error: ModelSelector no disponible. "
+            "Instala las dependencias necesarias.",
+            err=True,
+        )
+    except Exception as e:
+        click.echo(f"❌ Error: {e}", err=True)
+
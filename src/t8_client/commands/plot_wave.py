@@ -0,0 +1,30 @@
+import click  # type: ignore
+
+from t8_client.commands.common import (
+    authed_client,
+    date_options,
+    machine_point_mode_options,
+    resolve_when,
+)
+
+
+@click.command()
+@machine_point_mode_options
+@date_options
+def plot_wave(
+    machine: str,
+    point: str,
+    mode: str,
+    date: str | None = None,
+    timestamp: str | None = None,
+) -> None:
+    """Generates a plot of the specified wave.
+
+    If -d (date) or -t (timestamp) are not specified, the most
+    recent wave will be plotted.
+    The date must be in ISO 8601 format (2019-04-11T16:43:22).
+    The timestamp must be a Unix timestamp integer value."""
+
+    date_value = resolve_when(date, timestamp)
+    client = authed_client()
+    client.plot_wave(machine, point, mode, date_value)
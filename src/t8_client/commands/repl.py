@@ -0,0 +1,70 @@
+import shlex
+import sys
+
+import click  # type: ignore
+
+from t8_client.commands.common import _forget_token, authed_client
+
+
+@click.command()
+@click.pass_context
+def repl(ctx: click.Context) -> None:
+    """Runs commands read from stdin, one per line, in a single session.
+
+    The interpreter starts and logs in once, and every command reuses that
+    session until the API rejects it, then the next command logs in again.
+    Blank lines and lines starting with # are skipped. A failing line is
+    reported and the session goes on.
+    """
+    from t8_client.cli import cli
+
+    expired = False
+
+    def on_unauthorized() -> None:
+        nonlocal expired
+        _forget_token()
+        expired = True
+
+    client = authed_client()
+    client.on_unauthorized = on_unauthorized
+    failed = 0
+
+    for line in sys.stdin:
+        try:
+            args = shlex.split(line, comments=True)
+        except ValueError as e:
+            click.UsageError(f"{e}: {line.strip()}").show()
+            failed += 1
+            continue
+        if not args:
+            continue
+        if args[0] in ("exit", "quit"):
+            break
+        if args[0] == "repl":
+            click.echo("Error: repl cannot be nested", err=True)
+            failed += 1
+            continue
+
+        try:
+            if expired:
+                client = authed_client()
+                client.on_unauthorized = on_unauthorized
+                expired = False
+            cli.main(
+                args,
+                prog_name="t8-cli",
+                standalone_mode=False,
+                obj={"client": client},
+            )
+        except click.ClickException as e:
+            e.show()
+            failed += 1
+        except click.Abort:
+            click.echo("Aborted!", err=True)
+            failed += 1
+        except Exception as e:
+            click.echo(f"Error: {e}", err=True)
+            failed += 1
+
+    if failed:
+        ctx.exit(1)
@@ -0,0 +1,20 @@
+"""
+Loading of the .env file.
+
+python-dotenv is only imported, and .env only parsed, when some of the T8
+settings are not already exported.
+"""
+
+import os
+
+# Variables read from the environment by the client and the CLI
+T8_SETTINGS = ("T8_HOST", "T8_USER", "T8_PASSWORD")
+
+
+def ensure_env() -> None:
+    """Loads the .env file unless every T8 setting is already exported."""
+    if all(os.environ.get(name) for name in T8_SETTINGS):
+        return
+    from dotenv import load_dotenv  # type: ignore
+
+    load_dotenv()
@@ -1,26 +1,347 @@
-import base64
+import copy
+import functools
+import hashlib
 import json
+import math
 import os
-import struct
-import zlib
+import tempfile
+import time
+import types
+import zipfile
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime  # type: ignore
+from typing import TYPE_CHECKING
 
-# Configurar matplotlib para entornos sin GUI
-import matplotlib  # type: ignore
-import matplotlib.pyplot as plt  # type: ignore
 import numpy as np  # type: ignore
+import numpy.typing as npt  # type: ignore
 import requests  # type: ignore
-from dotenv import load_dotenv  # type: ignore
-
-matplotlib.use("Agg")  # Non-GUI backend by default
-
-# Load environment variables
-load_dotenv()
+from urllib3.util.retry import Retry  # type: ignore
+
+from t8_client.env import ensure_env
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure  # type: ignore
+
+# pybase64 decodes base64 with SIMD instructions and the same API, use it if present
+try:
+    import pybase64 as base64  # type: ignore
+except ImportError:
+    import base64
+
+# ISA-L's zlib (python-isal) inflates faster with the same API, use it if present
+try:
+    from isal import isal_zlib as zlib  # type: ignore
+except ImportError:
+    import zlib
+
+# pyFFTW computes the real FFT with multi-threaded FFTW plans, use it if present
+try:
+    import pyfftw  # type: ignore
+    from pyfftw.interfaces.numpy_fft import rfft as _rfft  # type: ignore
+
+    pyfftw.interfaces.cache.enable()
+    # Keep plans for a minute instead of 0.1 s, so spaced-out calls reuse them
+    pyfftw.interfaces.cache.set_keepalive_time(60.0)
+    pyfftw.config.NUM_THREADS = os.cpu_count() or 1
+    # FFTW only uses its SIMD codelets on inputs aligned to simd_alignment
+    _byte_align = pyfftw.byte_align
+except ImportError:
+    # Otherwise SciPy's pocketfft, which can split batches across every core
+    try:
+        from scipy.fft import rfft as _scipy_rfft  # type: ignore
+
+        _rfft = functools.partial(_scipy_rfft, workers=-1)
+    except ImportError:
+        from numpy.fft import rfft as _rfft
+
+    def _byte_align(array: np.ndarray) -> np.ndarray:
+        # pocketfft copies into its own buffers, alignment does not matter
+        return array
+
+
+# orjson parses and serializes several times faster than the stdlib json module
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+# Load environment variables from .env, unless they are already exported
+ensure_env()
 
 # Configure BASE_URL with fallback
 T8_HOST = os.getenv("T8_HOST", "https://lzfs45.mirror.twave.io/lzfs45")
 BASE_URL = T8_HOST + "/rest/"
 
+# URL templates, filled with machine, point, processing mode (and timestamp)
+_WAVES_URL_FMT = BASE_URL + "waves/{}/{}/{}"
+_SPECTRA_URL_FMT = BASE_URL + "spectra/{}/{}/{}"
+_WAVE_URL_FMT = _WAVES_URL_FMT + "/{}"
+_SPECTRUM_URL_FMT = _SPECTRA_URL_FMT + "/{}"
+
+# How long the confs/0 response is reused before fetching it again
+CONF_TTL_SECONDS = 300
+
+# Retries of idempotent requests on connection errors and gateway errors, the
+# last response is returned as is if they all fail
+HTTP_RETRIES = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    raise_on_status=False,
+)
+
+# Floating point types of the compute_spectrum precisions
+_PRECISION_DTYPES = {"single": np.float32, "double": np.float64}
+
+# Lines with more points than this are rasterized when saved to vector formats
+RASTERIZE_MIN_POINTS = 10_000
+
+# Number of decoded waves kept in memory by each client, see _load_wave_samples
+WAVE_CACHE_SIZE = 16
+
+
+def json_loads(raw: bytes | str) -> object:
+    """
+    Parses a JSON document, with orjson when it is installed.
+
+    Args:
+        raw: The JSON document
+
+    Returns:
+        object: The parsed document
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps(data: object) -> bytes:
+    """
+    Serializes data to UTF-8 JSON indented by two spaces.
+
+    orjson only supports a two-space indent, so the stdlib fallback uses the
+    same one and both write identical files.
+
+    Args:
+        data: The data to serialize
+
+    Returns:
+        bytes: The JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _save_arrays_atomically(path: str, **arrays: np.ndarray) -> None:
+    """
+    Saves arrays in .npz format, replacing path only once the file is complete.
+
+    The arrays are written to a temporary file in the same directory and then
+    renamed over path, so an interrupted or concurrent write never leaves a
+    truncated file behind.
+
+    Args:
+        path: Destination .npz file
+        arrays: The arrays to save, by name
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=os.path.basename(path) + ".", suffix=".tmp", dir=os.path.dirname(path)
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+@functools.lru_cache(maxsize=1)
+def _pyplot() -> types.ModuleType:
+    """
+    Imports matplotlib.pyplot on first use, with the non-GUI backend.
+
+    matplotlib takes most of the import time of this module and only the
+    plotting methods need it, so listing or downloading does not load it.
+
+    Returns:
+        module: The matplotlib.pyplot module
+    """
+    import matplotlib  # type: ignore
+
+    matplotlib.use("Agg")  # Non-GUI backend by default
+    import matplotlib.pyplot as plt  # type: ignore
+
+    return plt
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_timestamp(date: str) -> int:
+    """
+    Converts an ISO 8601 date or a timestamp string to an integer timestamp.
+
+    Results are cached, so replotting or batch-fetching the same dates does
+    not parse them again.
+
+    Args:
+        date: Date in ISO 8601 format (in local time) or timestamp
+
+    Returns:
+        int: Timestamp as an integer
+
+    Raises:
+        ValueError: If the date format is invalid
+    """
+    try:
+        if "T" in date:
+            dt = datetime.fromisoformat(date)
+            # If no timezone, treat as local time
+            # and convert directly to timestamp
+            return int(dt.timestamp())
+        else:
+            return int(date)
+    except ValueError as e:
+        raise ValueError(
+            "Format error: Not ISO 8601 (YYYY-MM-DDTHH:MM:SS) or integer timestamp."
+        ) from e
+
+
+def _format_timestamp(timestamp: int) -> str:
+    """
+    Formats a timestamp as an ISO 8601 local date, like 2025-01-01T12:00:00.
+
+    isoformat does not interpret a format string, it takes half as long as
+    strftime for the same text.
+
+    Args:
+        timestamp: Timestamp in seconds
+
+    Returns:
+        str: The local date, to the second
+
+    Raises:
+        ValueError, OSError: If the timestamp is out of range
+    """
+    return datetime.fromtimestamp(timestamp).isoformat(timespec="seconds")
+
+
+@functools.lru_cache(maxsize=8)
+def _hann_window(n: int, dtype: type) -> tuple[np.ndarray, float]:
+    """
+    Returns a Hann window and its coherent gain, computed once per length.
+
+    Args:
+        n: Number of samples of the waveform
+        dtype: Floating point type of the waveform
+
+    Returns:
+        tuple: (read-only window, mean of the window)
+    """
+    window = np.hanning(n).astype(dtype)
+    window.flags.writeable = False
+    return window, float(window.mean()) if n else 1.0
+
+
+@functools.lru_cache(maxsize=32)
+def _next_fast_len(n: int) -> int:
+    """
+    Returns the smallest length >= n with no prime factors other than 2, 3, 5, 7.
+
+    Args:
+        n: Number of samples
+
+    Returns:
+        int: The padded length
+    """
+    length = max(n, 1)
+    while True:
+        remainder = length
+        for factor in (2, 3, 5, 7):
+            while remainder % factor == 0:
+                remainder //= factor
+        if remainder == 1:
+            return length
+        length += 1
+
+
+def _count_bins_below(f: float, df: float, bins: int, inclusive: bool) -> int:
+    """
+    Counts the bins k * df, for k < bins, below f (or at f, if inclusive).
+
+    This is np.searchsorted(axis, f, side="right" if inclusive else "left") on
+    the frequency axis, without building the axis.
+
+    Args:
+        f: Frequency in Hz
+        df: Spacing of the bins in Hz
+        bins: Number of bins
+        inclusive: Also count a bin exactly at f
+
+    Returns:
+        int: Number of bins below f
+    """
+
+    def below(k: int) -> bool:
+        return k * df <= f if inclusive else k * df < f
+
+    # Estimate from the division, then correct its rounding against the bins
+    position = f / df
+    if position >= bins:
+        count = bins
+    elif position > 0:
+        count = math.ceil(position)
+    else:
+        count = 0
+    while count > 0 and not below(count - 1):
+        count -= 1
+    while count < bins and below(count):
+        count += 1
+    return count
+
+
+@functools.lru_cache(maxsize=32)
+def _spectrum_band(
+    n: int, sample_rate: float, fmin: float, fmax: float
+) -> tuple[np.ndarray, slice]:
+    """
+    Returns the frequencies of an n-sample real FFT within [fmin, fmax].
+
+    Only the positive half of the spectrum is used, without the Nyquist bin, and
+    the 0 Hz (DC) bin is excluded when fmin is 0. Results are cached, so
+    repeated spectra of the same length and range reuse the frequency axis.
+
+    Args:
+        n: Number of samples of the waveform
+        sample_rate: The sampling rate of the waveform in Hz
+        fmin: The minimum frequency of interest in Hz
+        fmax: The maximum frequency of interest in Hz
+
+    Returns:
+        tuple: (read-only frequencies in the range, slice of their FFT bins)
+    """
+    # Bin k is at k * df, exactly as np.fft.rfftfreq computes it
+    df = 1.0 / (n * (1 / sample_rate))
+    bins = n // 2
+
+    if fmin == 0:
+        fmin = df if bins > 1 else 0
+
+    # Only the bins of the range are materialized
+    start = _count_bins_below(fmin, df, bins, inclusive=False)
+    stop = _count_bins_below(fmax, df, bins, inclusive=True)
+    band_freqs = np.arange(start, stop) * df
+    band_freqs.flags.writeable = False
+    return band_freqs, slice(start, stop)
+
 
 def ensure_plots_directory() -> str:
     """
@@ -51,7 +372,36 @@ def get_plot_filename(filename: str) -> str:
 class T8ApiClient:
     def __init__(self) -> None:
         self.session = requests.Session()
+        self.session.headers.update({"Accept": "application/json"})
+        # Keep-alive pool shared by every request of this client
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=16, max_retries=HTTP_RETRIES
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.token = None
+        # Called when the API rejects the session cookies, see check_ok_response
+        self.on_unauthorized: Callable[[], None] | None = None
+        self._conf_cache: dict | None = None
+        self._conf_cache_ts = 0.0
+        # Lookup tables over the cached confs, see _index_conf
+        self._mode_index: dict[tuple, dict] = {}
+        self._point_unit_ids: dict[tuple, object] = {}
+        self._unit_labels: dict[object, str] = {}
+        # Figure reused by every plot, see _get_figure
+        self._fig: Figure | None = None
+        # Decoded waves by (machine, point, procMode, timestamp), oldest first
+        self._wave_cache: OrderedDict[tuple, tuple[float, np.ndarray]] = OrderedDict()
+
+    def close(self) -> None:
+        """Closes the pooled connections of the session."""
+        self.session.close()
+
+    def __enter__(self) -> "T8ApiClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def _parse_date_to_timestamp(self, date: str) -> int:
         """
@@ -67,23 +417,32 @@ class T8ApiClient:
         Raises:
             ValueError: If the date format is invalid
         """
-        try:
-            if "T" in str(date):
-                dt = datetime.fromisoformat(str(date))
-                # If no timezone, treat as local time
-                # and convert directly to timestamp
-                return int(dt.timestamp())
-            else:
-                return int(date)
-        except ValueError as e:
-            raise ValueError(
-                "Format error: Not ISO 8601 (YYYY-MM-DDTHH:MM:SS) or integer timestamp."
-            ) from e
+        return _parse_timestamp(str(date))
 
     def _setup_matplotlib_interactive(self) -> None:
         """Configures matplotlib to display interactive plots."""
+        _pyplot()  # Loads pyplot first, it would reset the backend to Agg
+        import matplotlib  # type: ignore
+
         matplotlib.use("WebAgg")
 
+    def _get_figure(self) -> "Figure":
+        """
+        Returns the figure shared by the plotting methods, cleared for a new plot.
+
+        The figure is created on first use, and again if it has been closed.
+
+        Returns:
+            matplotlib.figure.Figure: The empty figure, made the current one
+        """
+        plt = _pyplot()
+        if self._fig is None or not plt.fignum_exists(self._fig.number):
+            self._fig = plt.figure(figsize=(14, 8))
+        else:
+            plt.figure(self._fig.number)
+            self._fig.clear()
+        return self._fig
+
     def _save_and_show_plot(
         self,
         machine: str,
@@ -92,6 +451,8 @@ class T8ApiClient:
         plot_type: str,
         save_file: str | None = None,
         suffix: str = "",
+        save_dpi: int = 150,
+        tight_bbox: bool = False,
     ) -> None:
         """
         Saves and displays a matplotlib plot.
@@ -103,18 +464,25 @@ class T8ApiClient:
             plot_type: Plot type ('wave', 'spectrum')
             save_file: Custom path to save (optional)
             suffix: Additional suffix for the filename
+            save_dpi: Resolution of the saved image
+            tight_bbox: Crop the saved image to the drawn area, at the cost of an
+                extra render pass
         """
+        plt = _pyplot()
         plt.tight_layout()
+        savefig_options = {"dpi": save_dpi}
+        if tight_bbox:
+            savefig_options["bbox_inches"] = "tight"
 
         # Save the plot
         if save_file:
-            plt.savefig(save_file, dpi=300, bbox_inches="tight")
+            plt.savefig(save_file, **savefig_options)
             print(f"✓ Plot saved to: {save_file}")
         else:
             # Automatically save to data/plots/
             filename = f"{plot_type}_{machine}_{point}_{procMode}{suffix}_plot.png"
             auto_save = get_plot_filename(filename)
-            plt.savefig(auto_save, dpi=300, bbox_inches="tight")
+            plt.savefig(auto_save, **savefig_options)
             print(f"✓ Plot saved to: {auto_save}")
 
         # Show interactive plot
@@ -142,6 +510,67 @@ class T8ApiClient:
         proc_mode = parts[2] if len(parts) > 2 else "Unknown"
         return machine, point, proc_mode
 
+    def _get_conf(self, ttl: float = CONF_TTL_SECONDS) -> dict | None:
+        """
+        Returns the confs/0 configuration, fetching it at most once per ``ttl``.
+
+        The dict is the cached one the lookup tables point into, so callers
+        must not modify it; get_configuration hands out a copy.
+
+        Args:
+            ttl: Seconds a fetched configuration is reused
+
+        Returns:
+            dict | None: Configuration data or None if there's an error
+        """
+        if (
+            self._conf_cache is not None
+            and time.monotonic() - self._conf_cache_ts < ttl
+        ):
+            return self._conf_cache
+
+        response = self.session.get(BASE_URL + "confs/0")
+        conf_data = self.check_ok_response(response)
+        if conf_data:
+            self._index_conf(conf_data)
+            self._conf_cache = conf_data
+            self._conf_cache_ts = time.monotonic()
+        return conf_data
+
+    def invalidate_confs(self) -> None:
+        """Forgets the cached configuration, so the next use fetches it again."""
+        self._conf_cache = None
+        self._conf_cache_ts = 0.0
+
+    def _index_conf(self, conf_data: dict) -> None:
+        """
+        Builds the lookup tables used by _get_machine_config and getUnits.
+
+        The first proc_mode and unit with a given name/id win, and the last
+        point with a given name wins, as in a linear search of the confs.
+
+        Args:
+            conf_data: confs/0 configuration
+        """
+        mode_index = {}
+        point_unit_ids = {}
+        for machine in conf_data.get("machines", []):
+            machine_name = machine.get("name")
+            for p in machine.get("points", []):
+                key = (machine_name, p.get("name"))
+                sensor = p.get("input", {}).get("sensor", {})
+                point_unit_ids[key] = sensor.get("unit_id")
+                for mode in p.get("proc_modes", []):
+                    mode_index.setdefault((*key, mode.get("name")), mode)
+
+        unit_labels = {}
+        for unit in conf_data.get("units", []):
+            unit_labels.setdefault(unit.get("id"), unit.get("label", "Unknown Unit"))
+
+        self._mode_index = mode_index
+        self._point_unit_ids = point_unit_ids
+        self._unit_labels = unit_labels
+
     def _get_machine_config(
         self, machine_name: str, point: str, proc_mode: str
     ) -> dict | None:
@@ -157,24 +586,9 @@ class T8ApiClient:
             dict | None: Machine configuration or None if not found
         """
         try:
-            url = BASE_URL + "confs/0"
-            response = self.session.get(url)
-            conf_data = self.check_ok_response(response)
-
-            if not conf_data:
+            if not self._get_conf():
                 return None
-
-            machines = conf_data.get("machines", [])
-            for machine in machines:
-                if machine.get("name") == machine_name:
-                    points = machine.get("points", [])
-                    for p in points:
-                        if p.get("name") == point:
-                            proc_modes = p.get("proc_modes", [])
-                            for mode in proc_modes:
-                                if mode.get("name") == proc_mode:
-                                    return mode
-            return None
+            return self._mode_index.get((machine_name, point, proc_mode))
         except Exception:
             return None
 
@@ -192,6 +606,7 @@ class T8ApiClient:
                 response.status_code == 200
                 and "Invalid Username or Password" not in response.text
             ):
+                self.token = self.session.cookies.get_dict()
                 return True
             elif "Invalid Username or Password" in response.text:
                 print("Error: Invalid credentials")
@@ -203,17 +618,29 @@ class T8ApiClient:
             print(f"Error in login request: {e}")
             return False
 
+    def set_token(self, token: dict[str, str]) -> None:
+        """
+        Reuses the session cookies of a previous login instead of signing in.
+
+        Args:
+            token: Session cookies, as stored in ``self.token`` after a login
+        """
+        self.token = dict(token)
+        self.session.cookies.update(self.token)
+
     def get_configuration(self) -> dict | None:
         """
         Gets the complete system configuration from the API.
 
+        The response is shared with getUnits and _get_machine_config, and reused
+        for CONF_TTL_SECONDS (see invalidate_confs). The caller gets its own
+        copy, so changing it does not affect later lookups.
+
         Returns:
             dict | None: Configuration data or None if there's an error
         """
         try:
-            url = BASE_URL + "confs/0"
-            response = self.session.get(url)
-            return self.check_ok_response(response)
+            return copy.deepcopy(self._get_conf())
         except Exception as e:
             print(f"Error getting configuration: {e}")
             return None
@@ -221,12 +648,14 @@ class T8ApiClient:
     def check_ok_response(self, response: requests.Response) -> dict | None:
         if response.status_code == 200:
             try:
-                return response.json()
+                return json_loads(response.content)
             except ValueError as e:
                 print(f"Error parsing JSON: {e}")
                 print(f"Full response: {response.text}")
                 return None
         else:
+            if response.status_code == 401 and self.on_unauthorized is not None:
+                self.on_unauthorized()
             print(f"Error: {response.status_code} - {response.text}")
             return None
 
@@ -241,21 +670,25 @@ class T8ApiClient:
         waves = data.get("_items", [])
         print(f"\nFound {len(waves)} available waves:\n")
 
-        for i, wave in enumerate(waves, 1):
-            # Extract information from URL
-            wave_url = wave.get("_links", {}).get("self", "")
-            if wave_url:
-                # Extract machine, point, mode from URL
-                # Expected format: .../waves/MACHINE/POINT/MODE/
-                parts = wave_url.rstrip("/").split("/")
-                if len(parts) >= 3:
-                    machine = parts[-3]
-                    point = parts[-2]
-                    mode = parts[-1]
-                    print(f"{i:2d}. Machine: {machine}, Point: {point}, Mode: {mode}")
-                    print(f"    URL: {wave_url}")
-                else:
-                    print(f"{i:2d}. URL: {wave_url}")
+        # Extract the URLs first, then machine, point, mode from their last parts
+        # Expected format: .../waves/MACHINE/POINT/MODE/
+        urls = [wave.get("_links", {}).get("self", "") for wave in waves]
+        url_parts = [url.rstrip("/").rsplit("/", 2) for url in urls]
+
+        lines = []
+        for i, (wave_url, parts) in enumerate(zip(urls, url_parts, strict=True), 1):
+            if not wave_url:
+                continue
+            if len(parts) == 3:
+                machine, point, mode = parts
+                lines.append(
+                    f"{i:2d}. Machine: {machine}, Point: {point}, Mode: {mode}"
+                )
+                lines.append(f"    URL: {wave_url}")
+            else:
+                lines.append(f"{i:2d}. URL: {wave_url}")
+        if lines:
+            print("\n".join(lines))
 
     def _get_timestamp_from_item(self, item: dict) -> int:
         """
@@ -268,13 +701,15 @@ class T8ApiClient:
             int: Timestamp extracted from URL, or -1 if it cannot be extracted
         """
         item_url = item.get("_links", {}).get("self", "")
+        if not item_url:
+            return -1
         try:
-            return int(item_url.split("/")[-1]) if item_url else -1
+            return int(item_url.rpartition("/")[2])
         except ValueError:
             return -1
 
     def list_waves(self, machine: str, point: str, procMode: str) -> bool:
-        url = BASE_URL + "waves/" + machine + "/" + point + "/" + procMode
+        url = _WAVES_URL_FMT.format(machine, point, procMode)
         response = self.session.get(url)
         data = self.check_ok_response(response)
         if not data:
@@ -286,7 +721,7 @@ class T8ApiClient:
         return True
 
     def list_spectra(self, machine: str, point: str, procMode: str) -> bool:
-        url = BASE_URL + "spectra/" + machine + "/" + point + "/" + procMode
+        url = _SPECTRA_URL_FMT.format(machine, point, procMode)
         response = self.session.get(url)
         data = self.check_ok_response(response)
         if not data:
@@ -297,6 +732,94 @@ class T8ApiClient:
                 print(self.get_timestamp_and_formatted_wave_date(spectrum))
         return True
 
+    def _fetch_wave(
+        self, machine: str, point: str, procMode: str, timestamp: int
+    ) -> dict | None:
+        """
+        Downloads a wave from the API, without saving or reporting it.
+
+        Args:
+            machine: Machine ID
+            point: Measurement point
+            procMode: Processing mode
+            timestamp: Timestamp of the wave, 0 for the most recent
+
+        Returns:
+            dict | None: Wave data or None if there's an error
+        """
+        # Build URL to get specific wave
+        url = _WAVE_URL_FMT.format(machine, point, procMode, timestamp)
+        response = self.session.get(url)
+        return self.check_ok_response(response)
+
+    def _store_wave(
+        self, data: dict, machine: str, point: str, procMode: str, timestamp: int
+    ) -> None:
+        """Saves a downloaded wave to a JSON file and prints its summary."""
+        # Save to JSON file
+        self.save_to_file(data, machine, point, procMode, timestamp, is_wave=True)
+
+        # Display basic information
+        formatted_date = _format_timestamp(timestamp)
+        print("Wave downloaded successfully:")
+        print(f"   Machine: {machine}")
+        print(f"   Point: {point}")
+        print(f"   Mode: {procMode}")
+        print(f"   Timestamp: {timestamp}")
+        print(f"   Date: {formatted_date}")
+
+    def get_waves_batch(
+        self,
+        specs: list[tuple[str, str, str, str | int]],
+        max_workers: int = 8,
+    ) -> list[dict | None]:
+        """
+        Gets several waves, downloading them concurrently over the session.
+
+        The downloads run in a thread pool sharing this client's connection
+        pool; saving and reporting then happen in order, as with get_wave.
+
+        Args:
+            specs: (machine, point, procMode, date) of each wave
+            max_workers: Maximum number of simultaneous downloads
+
+        Returns:
+            list[dict | None]: Wave data of each spec, None for those that failed
+        """
+        timestamps: list[int | None] = []
+        for _, _, _, date in specs:
+            try:
+                timestamps.append(self._parse_date_to_timestamp(date))
+            except ValueError as e:
+                print(str(e))
+                timestamps.append(None)
+
+        def fetch(spec: tuple, timestamp: int | None) -> dict | None:
+            if timestamp is None:
+                return None
+            try:
+                return self._fetch_wave(spec[0], spec[1], spec[2], timestamp)
+            except Exception as e:
+                print(f"Error getting wave: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            downloaded = list(pool.map(fetch, specs, timestamps))
+
+        results: list[dict | None] = []
+        for spec, timestamp, data in zip(specs, timestamps, downloaded, strict=True):
+            if not data:
+                results.append(None)
+                continue
+            try:
+                self._store_wave(data, spec[0], spec[1], spec[2], timestamp)
+            except Exception as e:
+                print(f"Error getting wave: {e}")
+                results.append(None)
+                continue
+            results.append(data)
+        return results
+
     def get_wave(
         self, machine: str, point: str, procMode: str, date: str | int = 0
     ) -> dict | None:
@@ -320,37 +843,11 @@ class T8ApiClient:
             return None
 
         try:
-            # Build URL to get specific wave
-            url = (
-                BASE_URL
-                + "waves/"
-                + machine
-                + "/"
-                + point
-                + "/"
-                + procMode
-                + "/"
-                + str(timestamp)
-            )
-            response = self.session.get(url)
-            data = self.check_ok_response(response)
-
+            data = self._fetch_wave(machine, point, procMode, timestamp)
             if not data:
                 return None
 
-            # Save to JSON file
-            self.save_to_file(data, machine, point, procMode, timestamp, is_wave=True)
-
-            # Display basic information
-            formatted_date = datetime.fromtimestamp(timestamp).strftime(
-                "%Y-%m-%dT%H:%M:%S"
-            )
-            print("Wave downloaded successfully:")
-            print(f"   Machine: {machine}")
-            print(f"   Point: {point}")
-            print(f"   Mode: {procMode}")
-            print(f"   Timestamp: {timestamp}")
-            print(f"   Date: {formatted_date}")
+            self._store_wave(data, machine, point, procMode, timestamp)
 
             # Return wave data
             return data
@@ -359,7 +856,9 @@ class T8ApiClient:
             print(f"Error getting wave: {e}")
             return None
 
-    def decode_data(self, encoded_data: str, factor: float = 1.0) -> list[float]:
+    def decode_data(
+        self, encoded_data: str, factor: float = 1.0, verbose: bool = False
+    ) -> np.ndarray:
         """
         Decodes compressed wave data in base64 + zlib.
         Uses int16 little-endian which is the format that works best.
@@ -367,32 +866,35 @@ class T8ApiClient:
         Args:
             encoded_data: Data encoded in base64
             factor: Scaling factor to apply to data
+            verbose: Print the number of samples and their range
 
         Returns:
-            list[float]: Array of decoded samples
+            np.ndarray: float32 array of decoded samples (empty on error)
         """
         try:
             # Decode base64
-            compressed_data = base64.b64decode(encoded_data)
+            compressed_data = base64.b64decode(encoded_data, validate=False)
 
             # Decompress with zlib
             decompressed_data = zlib.decompress(compressed_data)
 
-            # Convert to int16 little-endian values
-            sample_count = len(decompressed_data) // 2
-            samples = struct.unpack(f"<{sample_count}h", decompressed_data)
+            # View the bytes as int16 little-endian values (no copy)
+            samples = np.frombuffer(decompressed_data, dtype="<i2")
 
-            # Apply scaling factor
-            scaled_samples = [sample * factor for sample in samples]
+            # Apply scaling factor, converting to float32 in the same pass
+            scaled_samples = np.empty(samples.shape, dtype=np.float32)
+            np.multiply(samples, np.float32(factor), out=scaled_samples)
 
-            print(f"Decoded {len(scaled_samples)} samples (int16 little-endian)")
-            print(f"Range: {min(scaled_samples):.2f} to {max(scaled_samples):.2f}")
+            if verbose:
+                print(f"Decoded {len(scaled_samples)} samples (int16 little-endian)")
+                low, high = scaled_samples.min(), scaled_samples.max()
+                print(f"Range: {low:.2f} to {high:.2f}")
 
             return scaled_samples
 
         except Exception as e:
             print(f"Error decoding wave data: {e}")
-            return []
+            return np.empty(0, dtype=np.float32)
 
     def get_spectrum(
         self, machine: str, point: str, procMode: str, date: str | int = 0
@@ -418,17 +920,7 @@ class T8ApiClient:
 
         try:
             # Build URL to get specific wave
-            url = (
-                BASE_URL
-                + "spectra/"
-                + machine
-                + "/"
-                + point
-                + "/"
-                + procMode
-                + "/"
-                + str(timestamp)
-            )
+            url = _SPECTRUM_URL_FMT.format(machine, point, procMode, timestamp)
             response = self.session.get(url)
             data = self.check_ok_response(response)
 
@@ -439,9 +931,7 @@ class T8ApiClient:
             self.save_to_file(data, machine, point, procMode, timestamp, is_wave=False)
 
             # Display basic information
-            formatted_date = datetime.fromtimestamp(timestamp).strftime(
-                "%Y-%m-%dT%H:%M:%S"
-            )
+            formatted_date = _format_timestamp(timestamp)
             print("Spectrum downloaded successfully:")
             print(f"   Machine: {machine}")
             print(f"   Point: {point}")
@@ -483,8 +973,8 @@ class T8ApiClient:
 
         # Save data to JSON file
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+            with open(filepath, "wb") as f:
+                f.write(json_dumps(data))
             print(f"   File saved: {filepath}")
         except Exception as e:
             print(f"Error saving file: {e}")
@@ -492,45 +982,52 @@ class T8ApiClient:
     def get_timestamp_and_formatted_wave_date(self, wave: dict) -> str | None:
         url = wave.get("_links", {}).get("self")
         # now parse the url and extract the date
-        url_parts = url.split("/")
-        fecha = url_parts[-1]  # Knowing that the date is the timestamp at the end
+        # Knowing that the date is the timestamp at the end
+        fecha = url.rpartition("/")[2]
         # Now give ISO 8601 format to the timestamp
         # like this example: 2025-01-01T12:00:00
         try:
             # Convert timestamp to integer and then to datetime
             timestamp = int(fecha)
-            fecha_formateada = datetime.fromtimestamp(timestamp).strftime(
-                "%Y-%m-%dT%H:%M:%S"
-            )
+            fecha_formateada = _format_timestamp(timestamp)
         except (ValueError, OSError):
             # If there's a conversion error, return the original timestamp
             fecha_formateada = fecha
         return fecha + " => " + fecha_formateada
 
-    def plot_wave(
-        self,
-        machine: str,
-        point: str,
-        procMode: str,
-        date: str | None = "0",
-        save_file: str | None = None,
-    ) -> None:
-        """Generates a wave plot using matplotlib.
+    def _load_wave_samples(
+        self, machine: str, point: str, procMode: str, date: str | int | None
+    ) -> tuple[float, np.ndarray] | None:
+        """
+        Gets a wave and decodes its samples, reusing recently decoded waves.
+
+        A wave requested by its timestamp never changes, so the last
+        WAVE_CACHE_SIZE of them are kept decoded and are neither fetched nor
+        decoded again. The most recent wave (timestamp 0) is always fetched.
 
         Args:
             machine: Machine ID
             point: Measurement point
             procMode: Processing mode
-            unit: Unit of measurement (e.g.: 'mm/s', 'g', 'm/s²')
-            date: Date/timestamp of the wave
-            save_file: Path to save the plot (optional)
+            date: Date in ISO 8601 format, timestamp, or None for the most recent
+
+        Returns:
+            tuple | None: Sample rate and read-only samples, or None on error
         """
-        self._setup_matplotlib_interactive()
-        print(f"Getting wave for {machine}:{point}:{procMode}...")
+        try:
+            timestamp = self._parse_date_to_timestamp(date)
+        except ValueError:
+            timestamp = 0  # get_wave reports the invalid date
+        key = (machine, point, procMode, timestamp)
+        cached = self._wave_cache.get(key)
+        if cached is not None:
+            self._wave_cache.move_to_end(key)
+            return cached
+
         wave_data = self.get_wave(machine, point, procMode, date)
         if not wave_data:
             print("Could not get wave.")
-            return
+            return None
 
         # Extract data from response
         encoded_data = wave_data.get("data", "")
@@ -539,44 +1036,77 @@ class T8ApiClient:
 
         if not encoded_data:
             print("No wave data to decode.")
-            return
+            return None
 
         print(f"Decoding data (factor: {factor}, fs: {sample_rate} Hz)...")
 
         # Decode compressed data
-        samples = self.decode_data(encoded_data, factor)
-        if not samples:
+        samples = self.decode_data(encoded_data, factor, verbose=True)
+        if samples.size == 0:
             print("Could not decode wave data.")
+            return None
+
+        if timestamp:
+            samples.flags.writeable = False
+            self._wave_cache[key] = (sample_rate, samples)
+            if len(self._wave_cache) > WAVE_CACHE_SIZE:
+                self._wave_cache.popitem(last=False)
+        return sample_rate, samples
+
+    def plot_wave(
+        self,
+        machine: str,
+        point: str,
+        procMode: str,
+        date: str | None = "0",
+        save_file: str | None = None,
+    ) -> None:
+        """Generates a wave plot using matplotlib.
+
+        Args:
+            machine: Machine ID
+            point: Measurement point
+            procMode: Processing mode
+            unit: Unit of measurement (e.g.: 'mm/s', 'g', 'm/s²')
+            date: Date/timestamp of the wave
+            save_file: Path to save the plot (optional)
+        """
+        self._setup_matplotlib_interactive()
+        print(f"Getting wave for {machine}:{point}:{procMode}...")
+        loaded = self._load_wave_samples(machine, point, procMode, date)
+        if loaded is None:
             return
+        sample_rate, samples = loaded
 
         # Create time array
         duration = len(samples) / sample_rate
-        times = [i / sample_rate for i in range(len(samples))]
+        times = np.arange(len(samples), dtype=np.float32) / np.float32(sample_rate)
 
         unit = self.getUnits(machine, point, procMode)
         print("Generating plot...")
 
         # Create plot
-        plt.figure(figsize=(14, 8))
-        plt.plot(times, samples, "b-", linewidth=0.8)
-        plt.title(
+        ax = self._get_figure().add_subplot(111)
+        line = ax.plot(times, samples, "b-", linewidth=0.8)[0]
+        line.set_rasterized(len(samples) > RASTERIZE_MIN_POINTS)
+        ax.set_title(
             f"Vibration Signal - {machine}:{point}:{procMode}",
             fontsize=14,
             fontweight="bold",
         )
-        plt.xlabel("Time (s)", fontsize=12)
-        plt.ylabel(f"Amplitude ({unit})", fontsize=12)
-        plt.grid(True, alpha=0.3)
+        ax.set_xlabel("Time (s)", fontsize=12)
+        ax.set_ylabel(f"Amplitude ({unit})", fontsize=12)
+        ax.grid(True, alpha=0.3)
 
         # Add information to the plot
         info_text = (
             f"Samples: {len(samples)}\nFs: {sample_rate} Hz\nDuration: {duration:.2f}s"
         )
-        plt.text(
+        ax.text(
             0.02,
             0.98,
             info_text,
-            transform=plt.gca().transAxes,
+            transform=ax.transAxes,
             verticalalignment="top",
             bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.8),
         )
@@ -587,7 +1117,7 @@ class T8ApiClient:
         print("✓ Plot generated successfully")
         print(f"  - {len(samples)} samples at {sample_rate} Hz")
         print(f"  - Duration: {duration:.2f} seconds")
-        print(f"  - Range: {min(samples):.2f} to {max(samples):.2f}")
+        print(f"  - Range: {samples.min():.2f} to {samples.max():.2f}")
 
     def getUnits(self, machine: str, point: str, procMode: str) -> str:
         """
@@ -597,31 +1127,16 @@ class T8ApiClient:
         unit_id.
         Once we have unit_id, I will go to the configuration to get units and
         look for the one with that id we got before.
+        Both searches are dictionary lookups in the tables built by _index_conf.
         """
         try:
-            url = BASE_URL + "confs/0"
-            response = self.session.get(url)
-            conf_data = self.check_ok_response(response)
-
-            if not conf_data:
+            if not self._get_conf():
                 return None
 
-            unit_id = None
-            machines = conf_data.get("machines", [])
-            for m in machines:
-                if m.get("name") == machine:
-                    points = m.get("points", [])
-                    for p in points:
-                        if p.get("name") == point:
-                            unit_id = (
-                                p.get("input", {}).get("sensor", {}).get("unit_id")
-                            )
-            if unit_id is not None:
-                units = conf_data.get("units", [])
-                for unit in units:
-                    if unit.get("id") == unit_id:
-                        return unit.get("label", "Unknown Unit")
-            return None
+            unit_id = self._point_unit_ids.get((machine, point))
+            if unit_id is None:
+                return None
+            return self._unit_labels.get(unit_id)
         except Exception:
             return None
 
@@ -664,17 +1179,14 @@ class T8ApiClient:
         )
 
         # Decode compressed data (use the same method as waves)
-        samples = self.decode_data(encoded_data, factor)
-        if not samples:
+        samples = self.decode_data(encoded_data, factor, verbose=True)
+        if samples.size == 0:
             print("Could not decode spectrum data.")
             return
 
         # Create frequency array
         num_samples = len(samples)
-        frequencies = [
-            min_freq + i * (max_freq - min_freq) / (num_samples - 1)
-            for i in range(num_samples)
-        ]
+        frequencies = np.linspace(min_freq, max_freq, num_samples, dtype=np.float32)
 
         # Get units automatically
         unit = self.getUnits(machine, point, procMode)
@@ -684,14 +1196,15 @@ class T8ApiClient:
         print("Generating plot...")
 
         # Create spectrum plot
-        plt.figure(figsize=(14, 8))
-        plt.plot(frequencies, samples, "b-", linewidth=0.8)
-        plt.title(
+        ax = self._get_figure().add_subplot(111)
+        line = ax.plot(frequencies, samples, "b-", linewidth=0.8)[0]
+        line.set_rasterized(len(samples) > RASTERIZE_MIN_POINTS)
+        ax.set_title(
             f"Spectrum - {machine}:{point}:{procMode}", fontsize=14, fontweight="bold"
         )
-        plt.xlabel("Frequency (Hz)", fontsize=12)
-        plt.ylabel(f"Amplitude ({unit})", fontsize=12)
-        plt.grid(True, alpha=0.3)
+        ax.set_xlabel("Frequency (Hz)", fontsize=12)
+        ax.set_ylabel(f"Amplitude ({unit})", fontsize=12)
+        ax.grid(True, alpha=0.3)
 
         # Add information to the plot
         info_text = (
@@ -699,11 +1212,11 @@ class T8ApiClient:
             f"Freq range: {min_freq}-{max_freq} Hz\n"
             f"Resolution: {(max_freq - min_freq) / (num_samples - 1):.3f} Hz"
         )
-        plt.text(
+        ax.text(
             0.02,
             0.98,
             info_text,
-            transform=plt.gca().transAxes,
+            transform=ax.transAxes,
             verticalalignment="top",
             bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.8),
         )
@@ -714,10 +1227,55 @@ class T8ApiClient:
         print("✓ Plot generated successfully")
         print(f"  - {num_samples} samples")
         print(f"  - Frequency: {min_freq:.3f} - {max_freq:.1f} Hz")
-        print(f"  - Range: {min(samples):.6f} to {max(samples):.6f}")
+        print(f"  - Range: {samples.min():.6f} to {samples.max():.6f}")
+
+    def _decoded_waveform(
+        self, wave_filepath: str | os.PathLike[str], data: dict
+    ) -> np.ndarray:
+        """
+        Decodes the samples of a wave file, reusing a cached copy when possible.
+
+        The decoded samples are kept in ``<wave_filepath>.npz`` together with a
+        digest of the encoded data and factor they come from, and reused only
+        while that digest matches, so a rewritten JSON file is never served
+        stale samples. A copy that cannot be loaded is decoded and written
+        again. Files of the most recent wave (timestamp 0) are rewritten on
+        every download and are not cached, like in _load_wave_samples.
+
+        Args:
+            wave_filepath: Path to the wave JSON file
+            data: Contents of the wave JSON file
+
+        Returns:
+            np.ndarray: Decoded samples
+        """
+        encoded_data = data.get("data")
+        factor = data.get("factor", 1.0)
+        name = os.path.splitext(os.path.basename(wave_filepath))[0]
+        if name.rpartition("_")[2] == "0" or not isinstance(encoded_data, str):
+            return self.decode_data(encoded_data, factor, verbose=True)
+
+        source = hashlib.blake2b(encoded_data.encode(), digest_size=16)
+        source.update(repr(factor).encode())
+        digest = np.frombuffer(source.digest(), dtype=np.uint8)
+        cache_path = os.fspath(wave_filepath) + ".npz"
+        try:
+            with np.load(cache_path) as cached:
+                if np.array_equal(cached["source"], digest):
+                    return cached["samples"]
+        except (OSError, ValueError, EOFError, KeyError, zipfile.BadZipFile):
+            pass  # No usable cached copy yet, or a damaged one
+
+        waveform = self.decode_data(encoded_data, factor, verbose=True)
+        if waveform.size:
+            try:
+                _save_arrays_atomically(cache_path, samples=waveform, source=digest)
+            except OSError:
+                pass  # The cache is an optimization, e.g. read-only directory
+        return waveform
 
     def compute_spectrum_from_wave_data(
-        self, wave_filepath: str
+        self, wave_filepath: str | os.PathLike[str]
     ) -> tuple[np.ndarray, np.ndarray, dict]:
         """
         Calculates a spectrum from a wave JSON file.
@@ -730,12 +1288,11 @@ class T8ApiClient:
         Returns:
             Tuple with (frequencies, amplitudes, metadata)
         """
-        with open(wave_filepath) as f:
-            data = json.load(f)
+        with open(wave_filepath, "rb") as f:
+            data = json_loads(f.read())
 
         # Extract wave data
-        waveform = data.get("data")
-        waveform = self.decode_data(waveform, data.get("factor", 1.0))
+        waveform = self._decoded_waveform(wave_filepath, data)
 
         # Extract information from path using helper function
         path = data.get("path", "Unknown:Unknown:Unknown")
@@ -758,7 +1315,7 @@ class T8ApiClient:
 
         # Calculate spectrum
         frequencies, amplitudes = T8ApiClient.compute_spectrum(
-            np.array(waveform), sample_rate, fmin, fmax
+            waveform, sample_rate, fmin, fmax
         )
 
         # Metadata
@@ -776,7 +1333,7 @@ class T8ApiClient:
 
         return frequencies, amplitudes, metadata
 
-    def compute_spectrum_with_json(self, wave_filepath: str) -> None:
+    def compute_spectrum_with_json(self, wave_filepath: str | os.PathLike[str]) -> None:
         """
         Calculates and displays a spectrum from a wave JSON file.
 
@@ -807,16 +1364,17 @@ class T8ApiClient:
 
         # Configure matplotlib and create plot
         self._setup_matplotlib_interactive()
-        plt.figure(figsize=(14, 8))
-        plt.plot(frequencies, amplitudes, "b-", linewidth=0.8)
-        plt.title(
+        ax = self._get_figure().add_subplot(111)
+        line = ax.plot(frequencies, amplitudes, "b-", linewidth=0.8)[0]
+        line.set_rasterized(len(amplitudes) > RASTERIZE_MIN_POINTS)
+        ax.set_title(
             f"Computed Spectrum - {machine_name}:{point}:{proc_mode}",
             fontsize=14,
             fontweight="bold",
         )
-        plt.xlabel("Frequency (Hz)", fontsize=12)
-        plt.ylabel(f"Amplitude ({unit})", fontsize=12)
-        plt.grid(True, alpha=0.3)
+        ax.set_xlabel("Frequency (Hz)", fontsize=12)
+        ax.set_ylabel(f"Amplitude ({unit})", fontsize=12)
+        ax.grid(True, alpha=0.3)
 
         # Add information to the plot
         info_text = (
@@ -824,11 +1382,11 @@ class T8ApiClient:
             f"Freq range: {min_freq}-{max_freq} Hz\n"
             f"Sample rate: {sample_rate} Hz"
         )
-        plt.text(
+        ax.text(
             0.02,
             0.98,
             info_text,
-            transform=plt.gca().transAxes,
+            transform=ax.transAxes,
             verticalalignment="top",
             bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.8),
         )
@@ -841,60 +1399,131 @@ class T8ApiClient:
         print("✓ Spectrum computed successfully")
         print(f"  - {len(amplitudes)} freq points")
         print(f"  - Frequency: {min_freq:.1f} - {max_freq:.1f} Hz")
-        min_val = min(amplitudes)
-        max_val = max(amplitudes)
+        min_val = amplitudes.min()
+        max_val = amplitudes.max()
         print(f"  - Range: {min_val:.6f} to {max_val:.6f}")
 
     @staticmethod
     def compute_spectrum(
-        waveform: np.ndarray, sample_rate: int, fmin: float, fmax: float
+        waveform: npt.NDArray[np.floating],
+        sample_rate: int,
+        fmin: float,
+        fmax: float,
+        precision: str = "single",
+        allow_padding: bool = False,
+        return_power: bool = False,
+        window: bool = False,
+        strict: bool = False,
     ) -> tuple[np.ndarray, np.ndarray]:
         """
         Compute the frequency spectrum of a given waveform within a specified frequency
         range.
 
         Parameters:
-        waveform: The input signal waveform.
+        waveform: The input signal waveform (see compute_spectra for several).
         sample_rate: The sampling rate of the waveform in Hz.
         fmin: The minimum frequency of interest in Hz.
         fmax: The maximum frequency of interest in Hz.
+        precision: "single" (float32, the default) or "double" (float64) for
+            the FFT and the returned magnitudes.
+        allow_padding: Zero-pad the waveform to the next length whose only
+            prime factors are 2, 3, 5 and 7, which the FFT handles fastest.
+            This makes the frequency bins slightly finer.
+        return_power: Return the squared magnitudes (power) instead of the
+            magnitudes.
+        window: Apply a Hann window before the FFT, to reduce leakage, and
+            correct the magnitudes for its coherent gain.
+        strict: Only accept NumPy arrays, instead of converting lists and other
+            sequences element by element.
 
         Returns:
         A tuple containing:
             - filtered_freqs: The corresponding frequencies within the
                 specified range.
             - filtered_spectrum: The magnitude of the frequency spectrum within
-                the specified range, with an RMS AC detector.
+                the specified range, with an RMS AC detector, or its square if
+                return_power is set.
+
+        Raises:
+        ValueError: If precision is not "single" or "double".
+        TypeError: If strict is set and waveform is not a NumPy array.
         """
-        # Convert list to numpy array if necessary
-        if not isinstance(waveform, np.ndarray):
-            waveform = np.array(waveform)
+        if strict and not isinstance(waveform, np.ndarray):
+            raise TypeError(
+                f"waveform must be a NumPy array, not {type(waveform).__name__}"
+            )
+        if precision not in _PRECISION_DTYPES:
+            raise ValueError(
+                f"precision must be 'single' or 'double', not {precision!r}"
+            )
+        dtype = _PRECISION_DTYPES[precision]
+
+        # Convert to an array of that precision if necessary (no copy if it is)
+        samples = np.asarray(waveform, dtype=dtype)
 
-        # Remove DC component (mean value)
-        waveform = waveform - np.mean(waveform)
+        # Remove DC component (mean value), in place if samples is already a copy
+        # Everything works along the last axis, so rows of a 2-D array are
+        # independent waveforms (see compute_spectra)
+        mean = samples.mean(axis=-1, keepdims=True)
+        if isinstance(waveform, np.ndarray) and np.may_share_memory(samples, waveform):
+            waveform = samples - mean
+        else:
+            samples -= mean
+            waveform = samples
+
+        # Apply Hanning window to reduce edge effects, waveform is our own copy
+        length = waveform.shape[-1]
+        gain = 1.0
+        if window:
+            hann, gain = _hann_window(length, dtype)
+            waveform *= hann
+
+        # Calculate FFT, only the non-negative frequencies of a real signal
+        n = _next_fast_len(length) if allow_padding else length
+        spectrum = _rfft(_byte_align(waveform), n)
+
+        # Magnitude of the bins within the frequency range, factor 2 for energy
+        filtered_freqs, band = _spectrum_band(n, sample_rate, fmin, fmax)
+        filtered_spectrum = np.abs(spectrum[..., band])
+        filtered_spectrum *= dtype(2 / (length * gain))
+        if return_power:
+            np.square(filtered_spectrum, out=filtered_spectrum)
 
-        # Apply Hanning window to reduce edge effects
-        # window = np.hanning(len(waveform))
-        # waveform_windowed = waveform * window
-        waveform_windowed = waveform.copy()
+        return filtered_freqs, filtered_spectrum
 
-        # Calculate FFT
-        spectrum = np.fft.fft(waveform_windowed)
-        magnitude = np.abs(spectrum) / len(spectrum)
-        freqs = np.fft.fftfreq(len(waveform), 1 / sample_rate)
+    @staticmethod
+    def compute_spectra(
+        waveforms: np.ndarray,
+        sample_rate: int,
+        fmin: float,
+        fmax: float,
+        precision: str = "single",
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the frequency spectra of several waveforms of the same length.
 
-        # Only use positive frequencies (first half of spectrum)
-        n = len(waveform) // 2
-        freqs_positive = freqs[:n]
-        magnitude_positive = magnitude[:n] * 2  # Factor 2 for energy
+        All the rows go through a single FFT call, which is faster than calling
+        compute_spectrum once per waveform.
 
-        # Exclude 0 Hz frequency (DC) from filtering if fmin is 0
-        if fmin == 0:
-            fmin = freqs_positive[1] if len(freqs_positive) > 1 else 0
+        Parameters:
+        waveforms: 2-D array with one waveform per row.
+        sample_rate: The sampling rate of the waveforms in Hz.
+        fmin: The minimum frequency of interest in Hz.
+        fmax: The maximum frequency of interest in Hz.
+        precision: "single" (float32, the default) or "double" (float64).
 
-        # Filter by frequency range
-        mask = (freqs_positive >= fmin) & (freqs_positive <= fmax)
-        filtered_freqs = freqs_positive[mask]
-        filtered_spectrum = magnitude_positive[mask]
+        Returns:
+        A tuple containing:
+            - filtered_freqs: The frequencies within the specified range,
+                shared by every waveform.
+            - filtered_spectra: 2-D array with the magnitude spectrum of each
+                waveform, one per row.
 
-        return filtered_freqs, filtered_spectrum
+        Raises:
+        ValueError: If waveforms is not 2-D or precision is not valid.
+        """
+        if np.ndim(waveforms) != 2:
+            raise ValueError("waveforms must be a 2-D array with one waveform per row")
+        return T8ApiClient.compute_spectrum(
+            waveforms, sample_rate, fmin, fmax, precision=precision
+        )
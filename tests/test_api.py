@@ -4,11 +4,20 @@ import os
 import tempfile
 import zlib
 from datetime import datetime
+from pathlib import Path
 
 import numpy as np  # type: ignore
+import pytest  # type: ignore
 import responses  # type: ignore
 
 from t8_client import BASE_URL, T8ApiClient
+from t8_client.t8_client import (
+    _format_timestamp,
+    _hann_window,
+    _next_fast_len,
+    _parse_timestamp,
+    _spectrum_band,
+)
 
 
 @responses.activate
@@ -208,6 +217,36 @@ def test_get_wave_exception() -> None:
     assert client.get_wave("test_machine", "test_point", "test_proc_mode", 0) is None
 
 
+@responses.activate
+def test_get_waves_batch(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a batch returns each wave, in order, and saves them."""
+    monkeypatch.chdir(tmp_path)
+    client = T8ApiClient()
+    for timestamp in (1555119736, 1555119800):
+        responses.add(
+            responses.GET,
+            BASE_URL + f"waves/m/p/AM1/{timestamp}",
+            json={"data": "", "t": timestamp},
+            status=200,
+        )
+    responses.add(
+        responses.GET, BASE_URL + "waves/m/p/AM1/1", body="Not Found", status=404
+    )
+
+    waves = client.get_waves_batch(
+        [
+            ("m", "p", "AM1", 1555119736),
+            ("m", "p", "AM1", "not-a-date"),
+            ("m", "p", "AM1", 1),
+            ("m", "p", "AM1", 1555119800),
+        ]
+    )
+
+    assert [w and w["t"] for w in waves] == [1555119736, None, None, 1555119800]
+    assert len(responses.calls) == 3
+    assert len(list((tmp_path / "data" / "waves").iterdir())) == 2
+
+
 @responses.activate
 def test_get_spectrum_success() -> None:
     client = T8ApiClient()
@@ -300,7 +339,10 @@ def test_decode_data_success() -> None:
     decoded = client.decode_data(encoded, factor=1.0)
 
     assert len(decoded) == len(test_samples)
-    assert decoded == [100.0, 200.0, 300.0, -100.0, -200.0, -300.0]
+    assert decoded.dtype == np.float32
+    np.testing.assert_array_equal(
+        decoded, [100.0, 200.0, 300.0, -100.0, -200.0, -300.0]
+    )
 
 
 def test_decode_data_with_factor() -> None:
@@ -316,16 +358,17 @@ def test_decode_data_with_factor() -> None:
     decoded = client.decode_data(encoded, factor=0.1)
 
     assert len(decoded) == 3
-    assert decoded == [10.0, 20.0, 30.0]
+    np.testing.assert_allclose(decoded, [10.0, 20.0, 30.0], rtol=1e-6)
 
 
 def test_decode_data_empty() -> None:
-    """Test decoding with invalid data returns empty list."""
+    """Test decoding with invalid data returns an empty array."""
     client = T8ApiClient()
 
     # Test with invalid base64
     decoded = client.decode_data("invalid_base64", factor=1.0)
-    assert decoded == []
+    assert isinstance(decoded, np.ndarray)
+    assert decoded.size == 0
 
 
 def test_decode_data_large_dataset() -> None:
@@ -401,6 +444,29 @@ def test_parse_date_invalid() -> None:
         assert "Format error" in str(e)
 
 
+def test_parse_date_is_cached() -> None:
+    """Test that parsing the same date again is served from the cache."""
+    client = T8ApiClient()
+    _parse_timestamp.cache_clear()
+
+    first = client._parse_date_to_timestamp("2025-01-15T12:30:45")
+    second = client._parse_date_to_timestamp("2025-01-15T12:30:45")
+
+    assert first == second
+    assert _parse_timestamp.cache_info().hits == 1
+
+
+def test_format_timestamp_round_trips() -> None:
+    """Test that formatted timestamps are parsed back to the same value."""
+    client = T8ApiClient()
+    timestamp = 1736944245
+
+    formatted = _format_timestamp(timestamp)
+
+    assert formatted == datetime.fromtimestamp(timestamp).strftime("%Y-%m-%dT%H:%M:%S")
+    assert client._parse_date_to_timestamp(formatted) == timestamp
+
+
 # ==============================================================================
 # Tests for _parse_machine_path()
 # ==============================================================================
@@ -603,6 +669,143 @@ def test_get_units_missing_unit_id() -> None:
     assert unit is None
 
 
+@responses.activate
+def test_gateway_error_is_retried() -> None:
+    """Test that a transient 503 is retried on the same session."""
+    responses.add(responses.GET, BASE_URL + "confs/0", status=503)
+    responses.add(responses.GET, BASE_URL + "confs/0", json={"units": []})
+
+    with T8ApiClient() as client:
+        assert client.get_configuration() == {"units": []}
+
+    assert len(responses.calls) == 2
+    assert responses.calls[0].request.headers["Accept"] == "application/json"
+
+
+@responses.activate
+def test_confs_fetched_once() -> None:
+    """Test that units and machine config share one confs/0 request."""
+    client = T8ApiClient()
+
+    responses.add(
+        responses.GET,
+        BASE_URL + "confs/0",
+        json={
+            "machines": [
+                {
+                    "name": "test_machine",
+                    "points": [
+                        {
+                            "name": "test_point",
+                            "input": {"sensor": {"unit_id": 14}},
+                            "proc_modes": [{"name": "test_mode", "sample_rate": 1000}],
+                        }
+                    ],
+                }
+            ],
+            "units": [{"id": 14, "label": "mm/s"}],
+        },
+        status=200,
+    )
+
+    assert client.getUnits("test_machine", "test_point", "test_mode") == "mm/s"
+    config = client._get_machine_config("test_machine", "test_point", "test_mode")
+    assert config["sample_rate"] == 1000
+    assert client.get_configuration()["units"] == [{"id": 14, "label": "mm/s"}]
+    assert len(responses.calls) == 1
+
+    client.invalidate_confs()
+    client.get_configuration()
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_get_configuration_returns_copy() -> None:
+    """Test that changing the returned configuration leaves the cache intact."""
+    client = T8ApiClient()
+
+    responses.add(
+        responses.GET,
+        BASE_URL + "confs/0",
+        json={
+            "machines": [
+                {
+                    "name": "test_machine",
+                    "points": [
+                        {
+                            "name": "test_point",
+                            "input": {"sensor": {"unit_id": 14}},
+                            "proc_modes": [{"name": "test_mode", "sample_rate": 1000}],
+                        }
+                    ],
+                }
+            ],
+            "units": [{"id": 14, "label": "mm/s"}],
+        },
+        status=200,
+    )
+
+    config = client.get_configuration()
+    config["units"][0]["label"] = "g"
+    config["machines"][0]["points"][0]["proc_modes"][0]["sample_rate"] = 1
+    config["machines"].clear()
+
+    assert client.getUnits("test_machine", "test_point", "test_mode") == "mm/s"
+    mode = client._get_machine_config("test_machine", "test_point", "test_mode")
+    assert mode["sample_rate"] == 1000
+    assert client.get_configuration()["machines"][0]["name"] == "test_machine"
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_confs_index_keeps_search_order() -> None:
+    """Test that indexed lookups match a first/last-match linear search."""
+    client = T8ApiClient()
+
+    responses.add(
+        responses.GET,
+        BASE_URL + "confs/0",
+        json={
+            "machines": [
+                {
+                    "name": "m",
+                    "points": [
+                        {
+                            "name": "p",
+                            "input": {"sensor": {"unit_id": 1}},
+                            "proc_modes": [
+                                {"name": "AM1", "sample_rate": 1},
+                                {"name": "AM1", "sample_rate": 2},
+                            ],
+                        },
+                        {"name": "p", "input": {"sensor": {"unit_id": 2}}},
+                    ],
+                }
+            ],
+            "units": [{"id": 2, "label": "g"}, {"id": 2, "label": "mm/s"}],
+        },
+        status=200,
+    )
+
+    assert client._get_machine_config("m", "p", "AM1")["sample_rate"] == 1
+    assert client.getUnits("m", "p", "AM1") == "g"
+    assert client.getUnits("m", "other", "AM1") is None
+
+
+@responses.activate
+def test_confs_refetched_after_ttl() -> None:
+    """Test that an expired confs/0 cache is fetched again."""
+    client = T8ApiClient()
+
+    responses.add(
+        responses.GET, BASE_URL + "confs/0", json={"machines": []}, status=200
+    )
+
+    client._get_conf()
+    client._get_conf(ttl=0)
+    assert len(responses.calls) == 2
+
+
 # ==============================================================================
 # Tests for compute_spectrum() - Static Method
 # ==============================================================================
@@ -669,6 +872,142 @@ def test_compute_spectrum_single_sample() -> None:
     assert len(spectrum) >= 0
 
 
+def test_compute_spectrum_matches_full_fft() -> None:
+    """Test the float32 spectrum against a float64 full FFT reference."""
+    sample_rate = 1000
+    waveform = np.random.default_rng(0).standard_normal(1001)
+
+    freqs, spectrum = T8ApiClient.compute_spectrum(waveform, sample_rate, 0, 500)
+
+    centered = waveform - waveform.mean()
+    ref_freqs = np.fft.fftfreq(1001, 1 / sample_rate)[1:500]
+    ref_spectrum = np.abs(np.fft.fft(centered))[1:500] * 2 / 1001
+    assert spectrum.dtype == np.float32
+    np.testing.assert_array_equal(freqs, ref_freqs)
+    np.testing.assert_allclose(spectrum, ref_spectrum, rtol=1e-4, atol=1e-6)
+
+
+def test_compute_spectrum_reuses_frequency_axis() -> None:
+    """Test that spectra of the same length and range share one axis."""
+    _spectrum_band.cache_clear()
+    waveform = np.random.default_rng(0).standard_normal(1000)
+
+    freqs_a, _ = T8ApiClient.compute_spectrum(waveform, 1000, 10, 100)
+    freqs_b, _ = T8ApiClient.compute_spectrum(waveform * 2, 1000, 10, 100)
+
+    assert _spectrum_band.cache_info().hits == 1
+    assert freqs_a is freqs_b
+    assert not freqs_a.flags.writeable
+
+
+def test_compute_spectrum_double_precision() -> None:
+    """Test that double precision keeps the magnitudes in float64."""
+    waveform = np.random.default_rng(0).standard_normal(1000)
+
+    _, single = T8ApiClient.compute_spectrum(waveform, 1000, 0, 500)
+    _, double = T8ApiClient.compute_spectrum(waveform, 1000, 0, 500, precision="double")
+
+    assert double.dtype == np.float64
+    np.testing.assert_allclose(single, double, rtol=1e-4, atol=1e-6)
+
+
+def test_compute_spectrum_power() -> None:
+    """Test that return_power gives the squared magnitudes."""
+    waveform = np.random.default_rng(0).standard_normal(1000)
+
+    freqs, magnitude = T8ApiClient.compute_spectrum(waveform, 1000, 10, 100)
+    power_freqs, power = T8ApiClient.compute_spectrum(
+        waveform, 1000, 10, 100, return_power=True
+    )
+
+    np.testing.assert_array_equal(power_freqs, freqs)
+    np.testing.assert_allclose(power, magnitude**2, rtol=1e-5)
+
+
+def test_compute_spectrum_window_keeps_amplitude() -> None:
+    """Test that the Hann window is corrected for its coherent gain."""
+    sample_rate = 1000
+    t = np.arange(1000) / sample_rate
+    waveform = 3 * np.sin(2 * np.pi * 50 * t)
+    _hann_window.cache_clear()
+
+    _, spectrum = T8ApiClient.compute_spectrum(
+        waveform, sample_rate, 0, 500, window=True
+    )
+    T8ApiClient.compute_spectrum(waveform, sample_rate, 0, 500, window=True)
+
+    assert spectrum.max() == pytest.approx(3.0, rel=0.01)
+    assert _hann_window.cache_info().hits == 1
+
+
+def test_compute_spectra_matches_single_calls() -> None:
+    """Test that batched spectra match one compute_spectrum call per row."""
+    waveforms = np.random.default_rng(0).standard_normal((3, 1000))
+
+    freqs, spectra = T8ApiClient.compute_spectra(waveforms, 1000, 10, 100)
+
+    assert spectra.shape == (3, len(freqs))
+    for row, waveform in zip(spectra, waveforms, strict=True):
+        row_freqs, row_spectrum = T8ApiClient.compute_spectrum(waveform, 1000, 10, 100)
+        np.testing.assert_array_equal(freqs, row_freqs)
+        np.testing.assert_allclose(row, row_spectrum, rtol=1e-5, atol=1e-7)
+
+
+def test_compute_spectra_rejects_1d() -> None:
+    """Test that compute_spectra requires one waveform per row."""
+    with pytest.raises(ValueError, match="2-D"):
+        T8ApiClient.compute_spectra(np.zeros(8), 1000, 0, 500)
+
+
+def test_compute_spectrum_strict_rejects_lists() -> None:
+    """Test that strict mode only accepts NumPy arrays."""
+    with pytest.raises(TypeError, match="NumPy array"):
+        T8ApiClient.compute_spectrum([0.0, 1.0, 0.0, -1.0], 4, 0, 2, strict=True)
+
+    freqs, _ = T8ApiClient.compute_spectrum(
+        np.array([0.0, 1.0, 0.0, -1.0]), 4, 0, 2, strict=True
+    )
+    assert len(freqs) == 1
+
+
+def test_compute_spectrum_leaves_input_untouched() -> None:
+    """Test that removing the DC in place never writes to the caller's array."""
+    waveform = np.arange(100, dtype=np.float32)
+    original = waveform.copy()
+
+    T8ApiClient.compute_spectrum(waveform, 1000, 0, 500)
+
+    np.testing.assert_array_equal(waveform, original)
+
+
+def test_next_fast_len() -> None:
+    """Test padding lengths only have the prime factors 2, 3, 5 and 7."""
+    assert _next_fast_len(1000) == 1000
+    assert _next_fast_len(1049) == 1050
+    assert _next_fast_len(1021) == 1024
+
+
+def test_compute_spectrum_padding() -> None:
+    """Test that padding keeps the amplitude of a tone at a finer resolution."""
+    sample_rate = 1049
+    t = np.arange(1049) / sample_rate
+    waveform = np.sin(2 * np.pi * 50 * t)
+
+    freqs, spectrum = T8ApiClient.compute_spectrum(
+        waveform, sample_rate, 0, 500, allow_padding=True
+    )
+
+    np.testing.assert_allclose(np.diff(freqs), sample_rate / 1050)
+    assert abs(freqs[np.argmax(spectrum)] - 50) < 1
+    assert spectrum.max() == pytest.approx(1.0, abs=0.05)
+
+
+def test_compute_spectrum_invalid_precision() -> None:
+    """Test that an unknown precision raises ValueError."""
+    with pytest.raises(ValueError, match="precision"):
+        T8ApiClient.compute_spectrum(np.zeros(8), 1000, 0, 500, precision="half")
+
+
 # ==============================================================================
 # Tests for compute_spectrum_from_wave_data()
 # ==============================================================================
@@ -751,9 +1090,10 @@ def test_compute_spectrum_from_wave_data() -> None:
             assert len(amplitudes) > 0
             assert len(freqs) == len(amplitudes)
     finally:
-        # Clean up temporary file
-        if os.path.exists(temp_filepath):
-            os.unlink(temp_filepath)
+        # Clean up temporary file and its decoded copy
+        for path in (temp_filepath, temp_filepath + ".npy"):
+            if os.path.exists(path):
+                os.unlink(path)
 
 
 # ==============================================================================
@@ -1,3 +1,8 @@
+import json
+import os
+import subprocess
+import sys
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -18,6 +23,9 @@ from t8_client import (
     plot_spectrum,
     plot_wave,
 )
+from t8_client.commands import common
+from t8_client.commands.chat_config import chat_config
+from t8_client.commands.common import credentials
 
 
 @pytest.fixture
@@ -26,6 +34,23 @@ def runner() -> CliRunner:
     return CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def isolated_token_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Fixture that keeps the login cache out of the real home directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path / ".cache" / "t8_client" / "token.json"
+
+
+@pytest.fixture(autouse=True)
+def fresh_credentials() -> Iterator[None]:
+    """Fixture that makes every test read the credentials and log in anew."""
+    credentials.cache_clear()
+    common._logged_in_client.cache_clear()
+    yield
+    credentials.cache_clear()
+    common._logged_in_client.cache_clear()
+
+
 @pytest.fixture
 def mock_env_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
     """Fixture that sets up mock environment credentials."""
@@ -91,7 +116,7 @@ class TestListWaves:
             list_waves, ["-M", "test_machine", "-P", "test_point", "-m", "test_mode"]
         )
 
-        assert result.exit_code == 0
+        assert result.exit_code == 1
         assert "Could not authenticate" in result.output
 
     def test_list_waves_no_credentials(
@@ -102,7 +127,7 @@ class TestListWaves:
             list_waves, ["-M", "test_machine", "-P", "test_point", "-m", "test_mode"]
         )
 
-        assert result.exit_code == 0
+        assert result.exit_code == 1
         assert "Credentials not found" in result.output
 
     def test_list_waves_missing_required_options(self, runner: CliRunner) -> None:
@@ -164,7 +189,7 @@ class TestListSpectra:
             list_spectra, ["-M", "test_machine", "-P", "test_point", "-m", "test_mode"]
         )
 
-        assert result.exit_code == 0
+        assert result.exit_code == 1
         assert "Could not authenticate" in result.output
 
     def test_list_spectra_no_credentials(
@@ -175,7 +200,7 @@ class TestListSpectra:
             list_spectra, ["-M", "test_machine", "-P", "test_point", "-m", "test_mode"]
         )
 
-        assert result.exit_code == 0
+        assert result.exit_code == 1
         assert "Credentials not found" in result.output
 
 
@@ -321,7 +346,7 @@ class TestGetWave:
             ],
         )
 
-        assert result.exit_code == 0
+        assert result.exit_code == 2
         assert "Cannot specify both --date and --timestamp" in result.output
 
     @responses.activate
@@ -341,7 +366,7 @@ class TestGetWave:
             get_wave, ["-M", "test_machine", "-P", "test_point", "-m", "test_mode"]
         )
 
-        assert result.exit_code == 0
+        assert result.exit_code == 1
         assert "Could not authenticate" in result.output
 
 
@@ -456,7 +481,7 @@ class TestGetSpectrum:
             ],
         )
 
-        assert result.exit_code == 0
+        assert result.exit_code == 2
         assert "Cannot specify both --date and --timestamp" in result.output
 
 
@@ -464,7 +489,7 @@ class TestPlotWave:
     """Tests for plot_wave CLI command."""
 
     @responses.activate
-    @patch("t8_client.cli.T8ApiClient.plot_wave")
+    @patch("t8_client.t8_client.T8ApiClient.plot_wave")
     def test_plot_wave_success(
         self, mock_plot: Mock, runner: CliRunner, mock_env_credentials: None
     ) -> None:
@@ -487,7 +512,7 @@ class TestPlotWave:
         )
 
     @responses.activate
-    @patch("t8_client.cli.T8ApiClient.plot_wave")
+    @patch("t8_client.t8_client.T8ApiClient.plot_wave")
     def test_plot_wave_with_timestamp(
         self, mock_plot: Mock, runner: CliRunner, mock_env_credentials: None
     ) -> None:
@@ -539,7 +564,7 @@ class TestPlotWave:
             ],
         )
 
-        assert result.exit_code == 0
+        assert result.exit_code == 2
         assert "Cannot specify both --date and --timestamp" in result.output
 
 
@@ -547,7 +572,7 @@ class TestPlotSpectrum:
     """Tests for plot_spectrum CLI command."""
 
     @responses.activate
-    @patch("t8_client.cli.T8ApiClient.plot_spectrum")
+    @patch("t8_client.t8_client.T8ApiClient.plot_spectrum")
     def test_plot_spectrum_success(
         self, mock_plot: Mock, runner: CliRunner, mock_env_credentials: None
     ) -> None:
@@ -570,7 +595,7 @@ class TestPlotSpectrum:
         )
 
     @responses.activate
-    @patch("t8_client.cli.T8ApiClient.plot_spectrum")
+    @patch("t8_client.t8_client.T8ApiClient.plot_spectrum")
     def test_plot_spectrum_with_date(
         self, mock_plot: Mock, runner: CliRunner, mock_env_credentials: None
     ) -> None:
@@ -651,7 +676,7 @@ class TestListAllWaves:
 
         result = runner.invoke(list_all_waves)
 
-        assert result.exit_code == 0
+        assert result.exit_code == 1
         assert "Could not authenticate" in result.output
 
     def test_list_all_waves_no_credentials(
@@ -660,7 +685,7 @@ class TestListAllWaves:
         """Test listing all waves without credentials."""
         result = runner.invoke(list_all_waves)
 
-        assert result.exit_code == 0
+        assert result.exit_code == 1
         assert "Credentials not found" in result.output
 
 
@@ -668,7 +693,7 @@ class TestComputeSpectrum:
     """Tests for compute_spectrum CLI command."""
 
     @responses.activate
-    @patch("t8_client.cli.T8ApiClient.compute_spectrum_with_json")
+    @patch("t8_client.t8_client.T8ApiClient.compute_spectrum_with_json")
     def test_compute_spectrum_success(
         self,
         mock_compute: Mock,
@@ -692,7 +717,7 @@ class TestComputeSpectrum:
         result = runner.invoke(compute_spectrum, [str(wave_file)])
 
         assert result.exit_code == 0
-        mock_compute.assert_called_once_with(str(wave_file))
+        mock_compute.assert_called_once_with(wave_file)
 
     @responses.activate
     def test_compute_spectrum_auth_failure(
@@ -713,64 +738,71 @@ class TestComputeSpectrum:
 
         result = runner.invoke(compute_spectrum, [str(wave_file)])
 
-        assert result.exit_code == 0
+        assert result.exit_code == 1
         assert "Could not authenticate" in result.output
 
+    @responses.activate
     def test_compute_spectrum_file_not_found(
         self, runner: CliRunner, mock_env_credentials: None
     ) -> None:
-        """Test spectrum computation with non-existent file."""
+        """Test that a missing file is reported before signing in."""
         result = runner.invoke(compute_spectrum, ["nonexistent_file.json"])
 
-        assert result.exit_code != 0
-        # Click will show error about file not existing
+        assert result.exit_code == 2
+        assert "does not exist" in result.output
+        assert len(responses.calls) == 0
 
 
 class TestCompareSpectra:
     """Tests for compare_spectra CLI command."""
 
-    @patch("subprocess.run")
-    def test_compare_spectra_success(
-        self, mock_run: Mock, runner: CliRunner, tmp_path: Path
-    ) -> None:
-        """Test successful spectra comparison."""
-        # Create temporary files
+    @pytest.fixture
+    def input_files(self, tmp_path: Path) -> tuple[Path, Path]:
+        """Fixture that creates the spectrum and wave input files."""
         spectrum_file = tmp_path / "spectrum.json"
         wave_file = tmp_path / "wave.json"
         spectrum_file.write_text('{"data": "spectrum"}')
         wave_file.write_text('{"data": "wave"}')
+        return spectrum_file, wave_file
 
-        # Mock subprocess.run to simulate successful execution
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Comparison successful"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+    @patch("t8_client.compare.compare_spectra", return_value=True)
+    def test_compare_spectra_success(
+        self, mock_compare: Mock, runner: CliRunner, input_files: tuple[Path, Path]
+    ) -> None:
+        """Test successful spectra comparison."""
+        spectrum_file, wave_file = input_files
 
         result = runner.invoke(compare_spectra, [str(spectrum_file), str(wave_file)])
 
         assert result.exit_code == 0
-        assert "Comparison successful" in result.output
-        mock_run.assert_called_once()
+        mock_compare.assert_called_once_with(spectrum_file, wave_file, None)
+
+    @patch("t8_client.compare.compare_spectra")
+    def test_compare_spectra_missing_file(
+        self, mock_compare: Mock, runner: CliRunner, input_files: tuple[Path, Path]
+    ) -> None:
+        """Test that a missing input is a usage error, before comparing."""
+        spectrum_file, _ = input_files
 
-    @patch("subprocess.run")
+        result = runner.invoke(
+            compare_spectra, [str(spectrum_file), "nonexistent_wave.json"]
+        )
+
+        assert result.exit_code == 2
+        assert "does not exist" in result.output
+        mock_compare.assert_not_called()
+
+    @patch("t8_client.compare.compare_spectra", return_value=True)
     def test_compare_spectra_with_output(
-        self, mock_run: Mock, runner: CliRunner, tmp_path: Path
+        self,
+        mock_compare: Mock,
+        runner: CliRunner,
+        input_files: tuple[Path, Path],
+        tmp_path: Path,
     ) -> None:
         """Test spectra comparison with output file."""
-        # Create temporary files
-        spectrum_file = tmp_path / "spectrum.json"
-        wave_file = tmp_path / "wave.json"
+        spectrum_file, wave_file = input_files
         output_file = tmp_path / "output.png"
-        spectrum_file.write_text('{"data": "spectrum"}')
-        wave_file.write_text('{"data": "wave"}')
-
-        # Mock subprocess.run
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Saved to output.png"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
 
         result = runner.invoke(
             compare_spectra,
@@ -778,55 +810,357 @@ class TestCompareSpectra:
         )
 
         assert result.exit_code == 0
-        assert mock_run.called
-        # Verify -o option was passed to subprocess
-        call_args = mock_run.call_args[0][0]
-        assert "-o" in call_args
+        mock_compare.assert_called_once_with(spectrum_file, wave_file, output_file)
 
-    @patch("subprocess.run")
-    def test_compare_spectra_script_failure(
-        self, mock_run: Mock, runner: CliRunner, tmp_path: Path
+    @patch("t8_client.compare.compare_spectra", return_value=False)
+    def test_compare_spectra_failure(
+        self, mock_compare: Mock, runner: CliRunner, input_files: tuple[Path, Path]
     ) -> None:
-        """Test spectra comparison when script fails."""
-        # Create temporary files
-        spectrum_file = tmp_path / "spectrum.json"
-        wave_file = tmp_path / "wave.json"
-        spectrum_file.write_text('{"data": "spectrum"}')
-        wave_file.write_text('{"data": "wave"}')
+        """Test spectra comparison when the comparison fails."""
+        spectrum_file, wave_file = input_files
+
+        result = runner.invoke(compare_spectra, [str(spectrum_file), str(wave_file)])
+
+        assert result.exit_code == 1
+        assert "Spectrum comparison failed" in result.output
 
-        # Mock subprocess.run to simulate failure
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Error in comparison"
-        mock_run.return_value = mock_result
+    @patch("t8_client.compare.compare_spectra")
+    def test_compare_spectra_exception(
+        self, mock_compare: Mock, runner: CliRunner, input_files: tuple[Path, Path]
+    ) -> None:
+        """Test spectra comparison when the comparison raises an exception."""
+        spectrum_file, wave_file = input_files
+        mock_compare.side_effect = Exception("Unexpected error")
 
         result = runner.invoke(compare_spectra, [str(spectrum_file), str(wave_file)])
 
+        assert result.exit_code == 1
+        assert "Error comparing spectra: Unexpected error" in result.output
+
+    def test_compare_spectra_invalid_spectrum(
+        self, runner: CliRunner, input_files: tuple[Path, Path]
+    ) -> None:
+        """Test that an unreadable spectrum file is reported in-process."""
+        spectrum_file, wave_file = input_files
+        spectrum_file.write_text("{}")
+
+        result = runner.invoke(compare_spectra, [str(spectrum_file), str(wave_file)])
+
+        assert result.exit_code == 1
+        assert "No spectrum data found in file" in result.output
+
+
+class TestAuthedClient:
+    """Tests for the shared login helper and its token cache."""
+
+    def _add_signin(self) -> None:
+        responses.add(
+            responses.POST,
+            "https://lzfs45.mirror.twave.io/lzfs45/signin",
+            body="OK",
+            status=200,
+            headers={"Set-Cookie": "session=abc123; Path=/"},
+        )
+
+    @responses.activate
+    def test_client_is_reused_in_process(self, mock_env_credentials: None) -> None:
+        """Test that commands of one process share a single client."""
+        self._add_signin()
+
+        assert common.authed_client() is common.authed_client()
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_login_is_cached(
+        self, mock_env_credentials: None, isolated_token_cache: Path
+    ) -> None:
+        """Test that a new process reuses the cached session cookies."""
+        self._add_signin()
+
+        first = common.authed_client()
+        common._logged_in_client.cache_clear()
+        second = common.authed_client()
+
+        assert first is not second
+        assert len(responses.calls) == 1
+        assert first.token == {"session": "abc123"}
+        assert second.session.cookies.get("session") == "abc123"
+        assert isolated_token_cache.stat().st_mode & 0o777 == 0o600
+
+    @responses.activate
+    def test_readable_token_file_is_made_private(
+        self, mock_env_credentials: None, isolated_token_cache: Path
+    ) -> None:
+        """Test that saving a login tightens an existing world-readable file."""
+        self._add_signin()
+        isolated_token_cache.parent.mkdir(parents=True, exist_ok=True)
+        isolated_token_cache.write_text("{}")
+        isolated_token_cache.chmod(0o644)
+
+        common.authed_client()
+
+        assert isolated_token_cache.stat().st_mode & 0o777 == 0o600
+        assert json.loads(isolated_token_cache.read_text())["token"] == {
+            "session": "abc123"
+        }
+        assert list(isolated_token_cache.parent.iterdir()) == [isolated_token_cache]
+
+    @responses.activate
+    def test_expired_login_signs_in_again(
+        self, mock_env_credentials: None, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an expired cached login is not reused."""
+        self._add_signin()
+        monkeypatch.setattr(common, "TOKEN_TTL_SECONDS", -1)
+        common.authed_client()
+        common._logged_in_client.cache_clear()
+        common.authed_client()
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_rejected_login_is_forgotten(
+        self, mock_env_credentials: None, isolated_token_cache: Path
+    ) -> None:
+        """Test that a 401 drops the cached login so the next run signs in."""
+        self._add_signin()
+        responses.add(responses.GET, f"{BASE_URL}confs/0", status=401)
+
+        client = common.authed_client()
+        assert isolated_token_cache.exists()
+        client.get_configuration()
+
+        assert not isolated_token_cache.exists()
+        assert common.authed_client() is not client
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_other_user_signs_in(
+        self, mock_env_credentials: None, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the login of another user is not reused."""
+        self._add_signin()
+        common.authed_client()
+        monkeypatch.setenv("T8_USER", "other_user")
+        credentials.cache_clear()
+        common.authed_client()
+
+        assert len(responses.calls) == 2
+
+
+class TestRepl:
+    """Tests for the repl CLI command."""
+
+    @responses.activate
+    @patch("t8_client.t8_client.T8ApiClient.get_wave")
+    @patch("t8_client.t8_client.T8ApiClient.list_available_waves")
+    def test_repl_logs_in_once(
+        self,
+        mock_list: Mock,
+        mock_get_wave: Mock,
+        runner: CliRunner,
+        mock_env_credentials: None,
+    ) -> None:
+        """Test that every command of the session reuses one login."""
+        responses.add(
+            responses.POST,
+            "https://lzfs45.mirror.twave.io/lzfs45/signin",
+            body="OK",
+            status=200,
+        )
+        commands = (
+            "# download and list\n"
+            "get-wave -M m1 -P p1 -m AM1 -t 1555119736\n"
+            "\n"
+            "list-all-waves\n"
+        )
+
+        result = runner.invoke(cli, ["repl"], input=commands)
+
         assert result.exit_code == 0
-        assert (
-            "failed with code" in result.output
-            or "Error in comparison" in result.output
+        assert len(responses.calls) == 1
+        mock_get_wave.assert_called_once_with("m1", "p1", "AM1", "1555119736")
+        mock_list.assert_called_once()
+
+    @responses.activate
+    @patch("t8_client.t8_client.T8ApiClient.list_available_waves")
+    def test_repl_continues_after_errors(
+        self, mock_list: Mock, runner: CliRunner, mock_env_credentials: None
+    ) -> None:
+        """Test that a failing line is reported and the session goes on."""
+        responses.add(
+            responses.POST,
+            "https://lzfs45.mirror.twave.io/lzfs45/signin",
+            body="OK",
+            status=200,
         )
+        commands = "get-wave -M m1\nno-such-command\nlist-all-waves\n"
 
-    @patch("subprocess.run")
-    def test_compare_spectra_exception(
-        self, mock_run: Mock, runner: CliRunner, tmp_path: Path
+        result = runner.invoke(cli, ["repl"], input=commands)
+
+        assert result.exit_code == 1
+        assert "Missing option" in result.output
+        assert "No such command" in result.output
+        mock_list.assert_called_once()
+
+    @responses.activate
+    @patch("t8_client.t8_client.T8ApiClient.list_available_waves")
+    def test_repl_reports_unbalanced_quotes(
+        self, mock_list: Mock, runner: CliRunner, mock_env_credentials: None
     ) -> None:
-        """Test spectra comparison when subprocess raises exception."""
-        # Create temporary files
-        spectrum_file = tmp_path / "spectrum.json"
-        wave_file = tmp_path / "wave.json"
-        spectrum_file.write_text('{"data": "spectrum"}')
-        wave_file.write_text('{"data": "wave"}')
+        """Test that a line that cannot be split is a usage error for that line."""
+        responses.add(
+            responses.POST,
+            "https://lzfs45.mirror.twave.io/lzfs45/signin",
+            body="OK",
+            status=200,
+        )
+        commands = 'get-wave -m "M1\nlist-all-waves\n'
 
-        # Mock subprocess.run to raise exception
-        mock_run.side_effect = Exception("Subprocess error")
+        result = runner.invoke(cli, ["repl"], input=commands)
 
-        result = runner.invoke(compare_spectra, [str(spectrum_file), str(wave_file)])
+        assert result.exit_code == 1
+        assert "No closing quotation" in result.output
+        mock_list.assert_called_once()
+
+    @responses.activate
+    @patch("t8_client.t8_client.T8ApiClient.list_available_waves")
+    def test_repl_reports_unexpected_errors(
+        self, mock_list: Mock, runner: CliRunner, mock_env_credentials: None
+    ) -> None:
+        """Test that an exception from a command does not end the session."""
+        responses.add(
+            responses.POST,
+            "https://lzfs45.mirror.twave.io/lzfs45/signin",
+            body="OK",
+            status=200,
+        )
+        mock_list.side_effect = [KeyError("_items"), None]
+
+        result = runner.invoke(cli, ["repl"], input="list-all-waves\n" * 2)
+
+        assert result.exit_code == 1
+        assert "Error: '_items'" in result.output
+        assert mock_list.call_count == 2
+
+    @responses.activate
+    def test_repl_logs_in_again_after_401(
+        self, runner: CliRunner, mock_env_credentials: None
+    ) -> None:
+        """Test that the command after a rejected session signs in again."""
+        signin = responses.add(
+            responses.POST,
+            "https://lzfs45.mirror.twave.io/lzfs45/signin",
+            body="OK",
+            status=200,
+        )
+        waves = BASE_URL + "waves/"
+        responses.add(responses.GET, waves, body="Unauthorized", status=401)
+        responses.add(responses.GET, waves, json={"_items": []}, status=200)
+
+        result = runner.invoke(cli, ["repl"], input="list-all-waves\n" * 2)
+
+        assert result.exit_code == 0
+        assert signin.call_count == 2
+        assert "Found 0 available waves" in result.output
+
+    def test_repl_no_credentials(
+        self, runner: CliRunner, mock_env_no_credentials: None
+    ) -> None:
+        """Test that the session does not start without credentials."""
+        result = runner.invoke(cli, ["repl"], input="list-all-waves\n")
+
+        assert result.exit_code == 1
+        assert "Credentials not found" in result.output
+
+
+class TestChatConfig:
+    """Tests for the chat-config CLI command."""
+
+    @patch("llm_client.GroqLLMClient")
+    def test_cache_stats_output(self, mock_llm: Mock, runner: CliRunner) -> None:
+        """Test that --cache-stats prints the totals, a blank line, the types."""
+        mock_llm.return_value.get_cache_stats.return_value = {
+            "available": True,
+            "total_entries": 3,
+            "total_size_bytes": 2048,
+            "configs": ["a", "b"],
+            "chunk_types": {"machines": 2, "points": 1},
+        }
+
+        result = runner.invoke(chat_config, ["--cache-stats"])
 
         assert result.exit_code == 0
-        assert "Error executing comparison script" in result.output
+        assert result.stdout == (
+            "📊 Cache Statistics:\n"
+            "\n"
+            "   Total entries: 3\n"
+            "   Total size: 2.00 KB\n"
+            "   Configurations: 2\n"
+            "\n"
+            "   Chunk types:\n"
+            "      - machines: 2\n"
+            "      - points: 1\n"
+        )
+
+    @patch("llm_client.GroqLLMClient")
+    def test_question_error_output(
+        self, mock_llm: Mock, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """Test that a failed single question is reported on stderr."""
+        mock_llm.return_value.ask_about_config.side_effect = RuntimeError("boom")
+        config_file = tmp_path / "config.json"
+        config_file.write_text("{}", encoding="utf-8")
+
+        result = runner.invoke(
+            chat_config, ["-c", str(config_file), "-q", "Which machines?"]
+        )
+
+        assert result.exit_code == 0
+        assert result.stderr == "\n❌ Error: boom\n"
+
+    @patch("llm_client.GroqLLMClient")
+    def test_interactive_piped_has_no_banner(
+        self, mock_llm: Mock, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """Test that the banner and spacing are left out when stdout is piped."""
+        mock_llm.return_value.ask_about_config.return_value = "Two machines"
+        config_file = tmp_path / "config.json"
+        config_file.write_text("{}", encoding="utf-8")
+
+        result = runner.invoke(
+            chat_config,
+            ["-c", str(config_file), "-i", "--no-stream"],
+            input="Which machines?\nexit\n",
+        )
+
+        assert result.exit_code == 0
+        assert "Interactive Mode" not in result.stdout
+        assert "=" * 70 not in result.stdout
+        assert "│ Which machines?\n┌─ 🤖 Assistant" in result.stdout
+        assert "│  Two machines\n" in result.stdout
+
+    @patch("llm_client.GroqLLMClient")
+    def test_interactive_terminal_shows_banner(
+        self, mock_llm: Mock, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """Test that the banner and spacing are printed on a terminal."""
+        mock_llm.return_value.ask_about_config.return_value = "Two machines"
+        config_file = tmp_path / "config.json"
+        config_file.write_text("{}", encoding="utf-8")
+
+        with patch("click.testing._NamedTextIOWrapper.isatty", return_value=True):
+            result = runner.invoke(
+                chat_config,
+                ["-c", str(config_file), "-i", "--no-stream"],
+                input="Which machines?\nexit\n",
+            )
+
+        assert result.exit_code == 0
+        assert "🤖 T8 Configuration Chat - Interactive Mode" in result.stdout
+        assert "=" * 70 in result.stdout
+        assert "│ Which machines?\n\n┌─ 🤖 Assistant" in result.stdout
+        assert "│  Two machines\n" in result.stdout
 
 
 class TestCLIGroup:
@@ -848,3 +1182,130 @@ class TestCLIGroup:
         assert "list-waves" in result.output or "list_waves" in result.output
         assert "get-wave" in result.output or "get_wave" in result.output
         assert "get-spectrum" in result.output or "get_spectrum" in result.output
+
+    def test_cli_help_does_not_import_client(self) -> None:
+        """Test that --help does not load the HTTP/plotting stack."""
+        code = (
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from t8_client import cli\n"
+            "CliRunner().invoke(cli, ['--help'])\n"
+            "heavy = ('t8_client.t8_client', 'requests', 'numpy', 'matplotlib')\n"
+            "print([m for m in heavy if m in sys.modules])\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_client_import_does_not_load_matplotlib(self) -> None:
+        """Test that matplotlib is only imported by the plotting methods."""
+        code = (
+            "import sys\n"
+            "from t8_client.t8_client import T8ApiClient\n"
+            "T8ApiClient()\n"
+            "print('matplotlib' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
+    def test_compare_import_does_not_load_pyplot(self) -> None:
+        """Test that pyplot is only imported when a comparison is plotted."""
+        code = (
+            "import sys\n"
+            "import t8_client.compare\n"
+            "print('matplotlib.pyplot' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
+    def test_exported_env_skips_dotenv(self, tmp_path: Path) -> None:
+        """Test that an API command does not load .env when the env is set."""
+        code = (
+            "import sys\n"
+            "import responses\n"
+            "from click.testing import CliRunner\n"
+            "from t8_client import BASE_URL, list_waves\n"
+            "with responses.RequestsMock() as mock:\n"
+            "    mock.add(responses.POST, BASE_URL[:-5] + 'signin', status=200)\n"
+            "    mock.add(responses.GET, BASE_URL + 'waves/m/p/AM1', json={})\n"
+            "    args = ['-M', 'm', '-P', 'p', '-m', 'AM1']\n"
+            "    result = CliRunner().invoke(list_waves, args)\n"
+            "print(result.exit_code, 'dotenv' in sys.modules)\n"
+        )
+        env = {
+            **os.environ,
+            "HOME": str(tmp_path),
+            "T8_HOST": "https://lzfs45.mirror.twave.io/lzfs45",
+            "T8_USER": "test_user",
+            "T8_PASSWORD": "test_pass",
+        }
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "0 False"
+
+    @pytest.mark.parametrize("args", [["--help"], []])
+    def test_static_help_matches_click_help(
+        self,
+        args: list[str],
+        runner: CliRunner,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture,
+    ) -> None:
+        """Test that the help fast path prints and exits the same as Click."""
+        from t8_client.__main__ import main
+
+        monkeypatch.setattr(sys, "argv", ["t8-cli", *args])
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        result = runner.invoke(cli, args, prog_name="t8-cli")
+        captured = capsys.readouterr()
+        assert exc_info.value.code == result.exit_code
+        assert captured.out == result.stdout
+        assert captured.err == result.stderr
+
+    def test_cli_help_does_not_import_commands(self) -> None:
+        """Test that --help lists commands without importing their modules."""
+        code = (
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from t8_client import cli\n"
+            "CliRunner().invoke(cli, ['--help'])\n"
+            "prefix = 't8_client.commands.'\n"
+            "print(sorted(m for m in sys.modules if m.startswith(prefix)))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_cli_unknown_command(self, runner: CliRunner) -> None:
+        """Test that an unknown subcommand is reported as a usage error."""
+        result = runner.invoke(cli, ["no-such-command"])
+
+        assert result.exit_code == 2
+        assert "No such command" in result.output
+
+    def test_cli_resolves_every_registered_command(self) -> None:
+        """Test that every registry entry points at a real command."""
+        from t8_client.commands import COMMANDS
+
+        for name in COMMANDS:
+            command = cli.get_command(None, name)
+            assert command is not None
+            assert command.name == name
@@ -1,8 +1,10 @@
 import json
 import os
 from pathlib import Path
-from typing import Never
+from typing import BinaryIO
+from unittest.mock import patch
 
+import matplotlib.pyplot as plt  # type: ignore
 import numpy as np  # type: ignore
 import pytest  # type: ignore
 import responses  # type: ignore
@@ -89,9 +91,7 @@ class TestT8ApiClient:
         # Mock response
         class MockResponse:
             status_code = 200
-
-            def json(self):  # noqa: ANN202
-                return {"success": True, "data": "test"}
+            content = b'{"success": true, "data": "test"}'
 
         result = client.check_ok_response(MockResponse())
 
@@ -121,11 +121,9 @@ class TestT8ApiClient:
         # Mock response
         class MockResponse:
             status_code = 200
+            content = b"Invalid JSON"
             text = "Invalid JSON"
 
-            def json(self) -> Never:
-                raise ValueError("Invalid JSON")
-
         result = client.check_ok_response(MockResponse())
 
         assert result is None
@@ -151,7 +149,7 @@ class TestT8ApiClient:
         result = client.decode_data(encoded, factor=1.0)
 
         assert len(result) == len(original_data)
-        assert result == original_data
+        np.testing.assert_array_equal(result, original_data)
 
     def test_decode_data_with_factor(self) -> None:
         """Test data decoding with scaling factor."""
@@ -172,7 +170,24 @@ class TestT8ApiClient:
         result = client.decode_data(encoded, factor=factor)
 
         assert len(result) == len(original_data)
-        assert result == [x * factor for x in original_data]
+        np.testing.assert_allclose(result, [x * factor for x in original_data])
+
+    def test_decode_data_verbose(self, capsys: pytest.CaptureFixture) -> None:
+        """Test that decode_data only reports the samples when verbose."""
+        import base64
+        import zlib
+
+        client = T8ApiClient()
+        raw = np.array([-3, 7], dtype="<i2").tobytes()
+        encoded = base64.b64encode(zlib.compress(raw)).decode("utf-8")
+
+        client.decode_data(encoded)
+        assert capsys.readouterr().out == ""
+
+        client.decode_data(encoded, verbose=True)
+        captured = capsys.readouterr()
+        assert "Decoded 2 samples" in captured.out
+        assert "Range: -3.00 to 7.00" in captured.out
 
     def test_decode_data_invalid(self) -> None:
         """Test decode_data with invalid data."""
@@ -180,7 +195,7 @@ class TestT8ApiClient:
 
         result = client.decode_data("invalid_base64_data")
 
-        assert result == []
+        assert result.size == 0
 
     def test_save_to_file_wave(
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
@@ -204,6 +219,22 @@ class TestT8ApiClient:
             saved_data = json.load(f)
         assert saved_data == data
 
+    def test_save_to_file_keeps_unicode(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test saved files are UTF-8 JSON with a two-space indent."""
+        monkeypatch.chdir(tmp_path)
+        client = T8ApiClient()
+
+        data = {"path": "Máquina:Punto:AM1", "factor": 1.0}
+
+        client.save_to_file(data, "machine1", "point1", "mode1", 1, True)
+
+        raw = Path("data", "waves", "wave_machine1_point1_mode1_1.json").read_bytes()
+        assert "Máquina".encode() in raw
+        assert b'\n  "factor"' in raw
+        assert json.loads(raw) == data
+
     def test_save_to_file_spectrum(
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -482,6 +513,294 @@ class TestSpectrumComputation:
         assert metadata["max_freq"] == 500
 
 
+class TestDecodedWaveCache:
+    """Tests for the .npz copy of decoded wave files."""
+
+    def _write_wave(self, path: Path, samples: list[int]) -> None:
+        import base64
+        import zlib
+
+        raw = np.array(samples, dtype="<i2").tobytes()
+        encoded = base64.b64encode(zlib.compress(raw)).decode("utf-8")
+        path.write_text(json.dumps({"data": encoded, "factor": 0.5}))
+
+    def test_decoded_wave_is_reused(self, tmp_path: Path) -> None:
+        """Test that a second read loads the .npz instead of decoding."""
+        client = T8ApiClient()
+        wave_file = tmp_path / "wave.json"
+        self._write_wave(wave_file, [2, 4, 6])
+        data = json.loads(wave_file.read_text())
+
+        first = client._decoded_waveform(wave_file, data)
+        with patch.object(client, "decode_data") as mock_decode:
+            second = client._decoded_waveform(wave_file, data)
+
+        mock_decode.assert_not_called()
+        assert (tmp_path / "wave.json.npz").exists()
+        np.testing.assert_array_equal(first, [1, 2, 3])
+        np.testing.assert_array_equal(second, first)
+
+    def test_rewritten_wave_with_same_mtime_is_decoded(self, tmp_path: Path) -> None:
+        """Test that new content is decoded even if the mtimes are equal."""
+        client = T8ApiClient()
+        wave_file = tmp_path / "wave.json"
+        cache_file = tmp_path / "wave.json.npz"
+        self._write_wave(wave_file, [2, 4, 6])
+        client._decoded_waveform(wave_file, json.loads(wave_file.read_text()))
+
+        self._write_wave(wave_file, [8, 10, 12])
+        mtime_ns = cache_file.stat().st_mtime_ns
+        os.utime(wave_file, ns=(mtime_ns, mtime_ns))
+        waveform = client._decoded_waveform(
+            wave_file, json.loads(wave_file.read_text())
+        )
+
+        np.testing.assert_array_equal(waveform, [4, 5, 6])
+
+    def test_latest_wave_is_not_cached(self, tmp_path: Path) -> None:
+        """Test that the file of the most recent wave gets no .npz copy."""
+        client = T8ApiClient()
+        wave_file = tmp_path / "wave_m_p_AM1_0.json"
+        self._write_wave(wave_file, [2, 4, 6])
+
+        waveform = client._decoded_waveform(
+            wave_file, json.loads(wave_file.read_text())
+        )
+
+        np.testing.assert_array_equal(waveform, [1, 2, 3])
+        assert sorted(p.name for p in tmp_path.iterdir()) == [wave_file.name]
+
+    @pytest.mark.parametrize("keep_bytes", [0, -4])
+    def test_truncated_copy_is_decoded_again(
+        self, tmp_path: Path, keep_bytes: int
+    ) -> None:
+        """Test that an empty or truncated .npz is decoded and rewritten."""
+        client = T8ApiClient()
+        wave_file = tmp_path / "wave.json"
+        cache_file = tmp_path / "wave.json.npz"
+        self._write_wave(wave_file, [2, 4, 6])
+        data = json.loads(wave_file.read_text())
+        client._decoded_waveform(wave_file, data)
+
+        cache_file.write_bytes(cache_file.read_bytes()[:keep_bytes])
+        waveform = client._decoded_waveform(wave_file, data)
+
+        np.testing.assert_array_equal(waveform, [1, 2, 3])
+        with np.load(cache_file) as cached:
+            np.testing.assert_array_equal(cached["samples"], [1, 2, 3])
+
+    def test_failed_write_leaves_no_file(self, tmp_path: Path) -> None:
+        """Test that an interrupted write neither creates nor leaks files."""
+        client = T8ApiClient()
+        wave_file = tmp_path / "wave.json"
+        self._write_wave(wave_file, [2, 4, 6])
+        data = json.loads(wave_file.read_text())
+
+        def interrupted_save(file: BinaryIO, **arrays: np.ndarray) -> None:
+            file.write(b"PK")
+            raise OSError("disk full")
+
+        with patch("numpy.savez", side_effect=interrupted_save):
+            waveform = client._decoded_waveform(wave_file, data)
+
+        np.testing.assert_array_equal(waveform, [1, 2, 3])
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["wave.json"]
+
+
+class TestPlotting:
+    """Tests for the plot axes built by the plotting methods."""
+
+    @staticmethod
+    def _encode(samples: list[int]) -> str:
+        import base64
+        import zlib
+
+        raw = np.array(samples, dtype="<i2").tobytes()
+        return base64.b64encode(zlib.compress(raw)).decode("utf-8")
+
+    def test_plot_wave_time_axis(self) -> None:
+        """Test that the wave is plotted against sample times."""
+        client = T8ApiClient()
+        wave = {"data": self._encode([1, 2, 3, 4]), "factor": 1.0, "sample_rate": 2}
+
+        with (
+            patch.object(client, "get_wave", return_value=wave),
+            patch.object(client, "getUnits", return_value="g"),
+            patch.object(client, "_setup_matplotlib_interactive"),
+            patch.object(client, "_save_and_show_plot"),
+            patch("matplotlib.axes.Axes.plot") as mock_plot,
+        ):
+            client.plot_wave("m", "p", "AM1")
+
+        times, samples = mock_plot.call_args[0][:2]
+        np.testing.assert_allclose(times, [0.0, 0.5, 1.0, 1.5])
+        np.testing.assert_allclose(samples, [1, 2, 3, 4])
+
+    def test_plot_wave_reports_decoded_samples(
+        self, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test that plotting still prints the decoded sample count and range."""
+        client = T8ApiClient()
+        wave = {"data": self._encode([1, 2, 3, 4]), "factor": 1.0, "sample_rate": 2}
+
+        with (
+            patch.object(client, "get_wave", return_value=wave),
+            patch.object(client, "getUnits", return_value="g"),
+            patch.object(client, "_setup_matplotlib_interactive"),
+            patch.object(client, "_save_and_show_plot"),
+            patch("matplotlib.axes.Axes.plot"),
+        ):
+            client.plot_wave("m", "p", "AM1")
+
+        out = capsys.readouterr().out
+        assert "Decoded 4 samples (int16 little-endian)" in out
+        assert "Range: 1.00 to 4.00" in out
+
+    def test_plot_spectrum_frequency_axis(self) -> None:
+        """Test that the spectrum bins span min_freq to max_freq."""
+        client = T8ApiClient()
+        spectrum = {
+            "data": self._encode([5, 6, 7, 8, 9]),
+            "factor": 1.0,
+            "min_freq": 10.0,
+            "max_freq": 50.0,
+        }
+
+        with (
+            patch.object(client, "get_spectrum", return_value=spectrum),
+            patch.object(client, "getUnits", return_value="g"),
+            patch.object(client, "_setup_matplotlib_interactive"),
+            patch.object(client, "_save_and_show_plot"),
+            patch("matplotlib.axes.Axes.plot") as mock_plot,
+        ):
+            client.plot_spectrum("m", "p", "AM1")
+
+        frequencies = mock_plot.call_args[0][0]
+        np.testing.assert_allclose(frequencies, [10.0, 20.0, 30.0, 40.0, 50.0])
+
+    def test_figure_is_reused(self) -> None:
+        """Test that successive plots draw on the same, cleared figure."""
+        client = T8ApiClient()
+        wave = {"data": self._encode([1, 2, 3, 4]), "factor": 1.0, "sample_rate": 2}
+
+        with (
+            patch.object(client, "get_wave", return_value=wave),
+            patch.object(client, "getUnits", return_value="g"),
+            patch.object(client, "_setup_matplotlib_interactive"),
+            patch.object(client, "_save_and_show_plot"),
+        ):
+            client.plot_wave("m", "p", "AM1")
+            first = client._fig
+            client.plot_wave("m", "p", "AM1")
+
+        assert client._fig is first
+        assert len(first.axes) == 1
+        plt.close(first)
+
+    def test_replotted_wave_is_not_fetched_again(self) -> None:
+        """Test that a wave plotted by timestamp is decoded only once."""
+        client = T8ApiClient()
+        wave = {"data": self._encode([1, 2, 3, 4]), "factor": 1.0, "sample_rate": 2}
+
+        with (
+            patch.object(client, "get_wave", return_value=wave) as mock_get,
+            patch.object(client, "getUnits", return_value="g"),
+            patch.object(client, "_setup_matplotlib_interactive"),
+            patch.object(client, "_save_and_show_plot"),
+            patch("matplotlib.axes.Axes.plot") as mock_plot,
+        ):
+            client.plot_wave("m", "p", "AM1", "1700000000")
+            client.plot_wave("m", "p", "AM1", "1700000000")
+            client.plot_wave("m", "p", "AM1")
+            client.plot_wave("m", "p", "AM1")
+
+        # The latest wave (timestamp 0) may change and is always fetched
+        assert mock_get.call_count == 3
+        samples = mock_plot.call_args_list[1][0][1]
+        np.testing.assert_allclose(samples, [1, 2, 3, 4])
+        assert not samples.flags.writeable
+
+    def test_save_plot_defaults(self, tmp_path: Path) -> None:
+        """Test that plots are saved at 150 dpi without the tight bbox pass."""
+        client = T8ApiClient()
+        save_file = str(tmp_path / "plot.png")
+
+        with (
+            patch("matplotlib.pyplot.savefig") as mock_savefig,
+            patch("matplotlib.pyplot.show"),
+        ):
+            client._save_and_show_plot("m", "p", "AM1", "wave", save_file)
+            client._save_and_show_plot(
+                "m", "p", "AM1", "wave", save_file, save_dpi=300, tight_bbox=True
+            )
+
+        assert mock_savefig.call_args_list[0].kwargs == {"dpi": 150}
+        assert mock_savefig.call_args_list[1].kwargs == {
+            "dpi": 300,
+            "bbox_inches": "tight",
+        }
+
+
+class TestCompareSpectra:
+    """Tests for the API vs calculated spectrum comparison plot."""
+
+    @staticmethod
+    def _write_inputs(tmp_path: Path) -> tuple[Path, Path]:
+        encode = TestPlotting._encode
+        spectrum_file = tmp_path / "spectrum.json"
+        spectrum_file.write_text(
+            json.dumps(
+                {
+                    "data": encode([5, 6, 7, 8, 9]),
+                    "factor": 1.0,
+                    "min_freq": 10.0,
+                    "max_freq": 50.0,
+                    "path": "m:p:AM1",
+                }
+            )
+        )
+        wave_file = tmp_path / "wave.json"
+        wave_file.write_text(
+            json.dumps(
+                {
+                    "data": encode([int(100 * np.sin(i)) for i in range(64)]),
+                    "factor": 1.0,
+                    "sample_rate": 128,
+                    "path": "m:p:AM1",
+                }
+            )
+        )
+        return spectrum_file, wave_file
+
+    def test_figure_is_closed(self, tmp_path: Path) -> None:
+        """Test that the comparison figure is saved and then closed."""
+        from t8_client.compare import compare_spectra
+
+        spectrum_file, wave_file = self._write_inputs(tmp_path)
+        output_file = tmp_path / "comparison.png"
+        open_figures = plt.get_fignums()
+
+        assert compare_spectra(spectrum_file, wave_file, output_file)
+
+        assert output_file.exists()
+        assert plt.get_fignums() == open_figures
+
+    def test_figure_is_closed_when_saving_fails(self, tmp_path: Path) -> None:
+        """Test that a failed save does not leave the figure open."""
+        from t8_client.compare import compare_spectra
+
+        spectrum_file, wave_file = self._write_inputs(tmp_path)
+        open_figures = plt.get_fignums()
+
+        with (
+            patch("matplotlib.figure.Figure.savefig", side_effect=OSError("full")),
+            pytest.raises(OSError),
+        ):
+            compare_spectra(spectrum_file, wave_file, tmp_path / "comparison.png")
+
+        assert plt.get_fignums() == open_figures
+
+
 class TestDataValidation:
     """Tests for data validation and edge cases."""
 
@@ -491,7 +810,7 @@ class TestDataValidation:
 
         result = client.decode_data("", factor=1.0)
 
-        assert result == []
+        assert result.size == 0
 
     def test_parse_date_negative_timestamp(self) -> None:
         """Test parsing negative timestamp."""